@@ -13,38 +13,55 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import click
-import yaml
 
-from metagit.core.utils.files import (
-    FileExtensionLookup,
-    directory_details,
-    directory_summary,
-)
+# yaml and metagit.core.utils.files are imported inside categorize_directory() so
+# `--help` and argument errors return without loading PyYAML or pydantic.
+
+
+# Field names per record class (NamedTuple ``_fields`` or Pydantic ``model_fields``),
+# keyed by id(type) so each class is inspected only once per run.
+_RECORD_FIELDS: dict = {}
+
+
+def _record_fields(cls):
+    """Return the field names for a NamedTuple/Pydantic class, or None for other types."""
+    key = id(cls)
+    if key not in _RECORD_FIELDS:
+        fields = getattr(cls, "_fields", None)
+        if fields is None:
+            model_fields = getattr(cls, "model_fields", None)
+            fields = tuple(model_fields) if isinstance(model_fields, dict) else None
+        _RECORD_FIELDS[key] = fields
+    return _RECORD_FIELDS[key]
 
 
 def convert_namedtuple_to_dict(obj):
-    """Convert NamedTuple objects to dictionaries for YAML serialization."""
-    if hasattr(obj, "_asdict"):
-        # Handle NamedTuple
-        result = obj._asdict()
-        # Recursively convert nested NamedTuples
-        for key, value in result.items():
-            if isinstance(value, list):
-                result[key] = [convert_namedtuple_to_dict(item) for item in value]
-            elif hasattr(value, "_asdict"):
-                result[key] = convert_namedtuple_to_dict(value)
-            elif isinstance(value, dict):
-                # Handle nested dictionaries (like file_types)
-                result[key] = {
-                    k: convert_namedtuple_to_dict(v) for k, v in value.items()
-                }
-        return result
-    elif isinstance(obj, list):
-        return [convert_namedtuple_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: convert_namedtuple_to_dict(v) for k, v in obj.items()}
-    else:
-        return obj
+    """Convert NamedTuple/Pydantic objects to dictionaries for YAML serialization.
+
+    Walks the structure with an explicit stack instead of recursion; each converted
+    container is written back into its parent slot so nested values are replaced in place.
+    """
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, slot, value = stack.pop()
+        cls = type(value)
+        if cls is dict:
+            converted = dict(value)
+            children = converted.items()
+        elif cls is list:
+            converted = list(value)
+            children = enumerate(converted)
+        else:
+            fields = _record_fields(cls)
+            if fields is None:
+                # Scalars and unknown objects are left untouched
+                continue
+            converted = {name: getattr(value, name) for name in fields}
+            children = converted.items()
+        parent[slot] = converted
+        stack.extend((converted, key, child) for key, child in children)
+    return root[0]
 
 
 @click.command()
@@ -84,31 +101,47 @@ def categorize_directory(path: str, output_type: str, output_file: str):
 
         click.echo(f"Analyzing directory: {target_path}")
 
+        import yaml
+
+        try:
+            from yaml import CSafeDumper
+        except ImportError:  # libyaml not available
+            from yaml import SafeDumper as CSafeDumper
+
+        from metagit.core.utils.files import (
+            directory_details,
+            directory_summary,
+            get_default_lookup,
+        )
+
         # Generate the appropriate output based on type
         if output_type == "summary":
             result = directory_summary(str(target_path))
-            # Convert Pydantic model to dict for YAML serialization
-            output_data = result.model_dump()
         else:  # details
-            file_lookup = FileExtensionLookup()
+            file_lookup = get_default_lookup()
             result = directory_details(str(target_path), file_lookup)
-            # Convert NamedTuple to dict for YAML serialization
-            output_data = convert_namedtuple_to_dict(result)
-
-        # Convert to YAML
-        yaml_output = yaml.dump(
-            output_data, default_flow_style=False, indent=2, sort_keys=False
-        )
 
-        # Output the result
+        # Read model fields directly rather than going through model_dump();
+        # the result was already validated when it was built.
+        output_data = convert_namedtuple_to_dict(result)
+
+        # Stream YAML straight to its destination instead of building the whole document first
+        dump_options = {
+            "Dumper": CSafeDumper,
+            "default_flow_style": False,
+            "indent": 2,
+            "sort_keys": False,
+        }
         if output_file:
-            with open(output_file, "w") as f:
-                f.write(yaml_output)
+            # Binary handle + encoding: the emitter writes UTF-8 bytes with no text-layer re-encoding
+            with open(output_file, "wb") as f:
+                yaml.dump(output_data, f, encoding="utf-8", **dump_options)
             click.echo(f"Output written to: {output_file}")
         else:
             click.echo("Directory Analysis Results:")
             click.echo("=" * 50)
-            click.echo(yaml_output)
+            sys.stdout.flush()
+            yaml.dump(output_data, sys.stdout, **dump_options)
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
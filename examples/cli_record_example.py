@@ -3,26 +3,84 @@
 Example script demonstrating the new record CLI commands.
 
 This script shows how to use the record management commands programmatically.
+Commands run in-process through click's CliRunner; pass --subprocess to send
+them to a single long-lived ``metagit repl`` process over stdin instead.
 """
 
+import shlex
 import subprocess
+import sys
 from pathlib import Path
 
+# Run commands in-process by default; pass --subprocess to exercise the real CLI entry point.
+USE_SUBPROCESS = "--subprocess" in sys.argv[1:]
+
+# Marker printed by `metagit repl` after each command (see metagit.cli.commands.repl)
+REPL_DELIMITER = "__METAGIT_DONE__"
+
+# A single runner is shared by every demo step so click/pydantic import once.
+# It is created on first use, so --subprocess runs never import the CLI here.
+_runner = None
+
+# Warm `metagit repl` process reused by every step when --subprocess is given.
+_repl_process = None
+
 
 def run_metagit_command(args: list) -> tuple[int, str, str]:
     """Run a metagit command and return the result."""
+    if USE_SUBPROCESS:
+        return _run_metagit_repl(args)
+    global _runner
     try:
-        result = subprocess.run(
-            ["python", "-m", "metagit.cli.main"] + args,
-            capture_output=True,
-            text=True,
-            cwd=Path.cwd(),
-        )
-        return result.returncode, result.stdout, result.stderr
+        from click.testing import CliRunner
+
+        from metagit.cli.main import cli
+
+        if _runner is None:
+            _runner = CliRunner()
+        result = _runner.invoke(cli, args)
+        return result.exit_code, result.stdout, result.stderr
     except Exception as e:
         return 1, "", str(e)
 
 
+def _run_metagit_repl(args: list) -> tuple[int, str, str]:
+    """Send a command to the shared `metagit repl` process and collect its output."""
+    global _repl_process
+    try:
+        if _repl_process is None:
+            _repl_process = subprocess.Popen(
+                [sys.executable, "-m", "metagit.cli.main", "repl"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=Path.cwd(),
+            )
+        _repl_process.stdin.write(shlex.join(args) + "\n")
+        _repl_process.stdin.flush()
+        lines = []
+        for line in _repl_process.stdout:
+            if line.startswith(REPL_DELIMITER):
+                output = "".join(lines)
+                return int(line.split()[1]), output, output
+            lines.append(line)
+        return 1, "", "metagit repl exited unexpectedly:\n" + "".join(lines)
+    except Exception as e:
+        return 1, "", str(e)
+
+
+def stop_repl():
+    """Shut down the shared `metagit repl` process, if one was started."""
+    global _repl_process
+    if _repl_process is None:
+        return
+    _repl_process.stdin.write("exit\n")
+    _repl_process.stdin.close()
+    _repl_process.wait(timeout=10)
+    _repl_process = None
+
+
 def create_sample_config():
     """Create a sample .metagit.yml file for testing."""
     config_content = """
@@ -217,4 +275,5 @@ if __name__ == "__main__":
     try:
         example_record_commands()
     finally:
+        stop_repl()
         cleanup()
@@ -10,11 +10,14 @@ from pathlib import Path
 # Add the metagit package to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from metagit.core.detect.manager import DetectionManager, DetectionManagerConfig
+# Each example imports what it uses, so config-only examples never load the
+# manager (GitPython, detectors) and the script starts quickly.
 
 
 def example_basic_usage():
     """Demonstrate basic usage with default configuration."""
+    from metagit.core.detect.manager import DetectionManager
+
     print("=== Basic Usage (Default Configuration) ===")
 
     # Create a DetectionManager with default config (all enabled)
@@ -40,6 +43,8 @@ def example_basic_usage():
 
 def example_custom_config():
     """Demonstrate usage with custom configuration."""
+    from metagit.core.detect.manager import DetectionManager, DetectionManagerConfig
+
     print("=== Custom Configuration ===")
 
     # Create a custom configuration
@@ -72,6 +77,8 @@ def example_custom_config():
 
 def example_preset_configs():
     """Demonstrate usage with preset configurations."""
+    from metagit.core.detect.models import DetectionManagerConfig
+
     print("=== Preset Configurations ===")
 
     # Use minimal configuration
@@ -90,6 +97,8 @@ def example_preset_configs():
 
 def example_specific_method():
     """Demonstrate running a specific analysis method."""
+    from metagit.core.detect.manager import DetectionManager, DetectionManagerConfig
+
     print("=== Running Specific Method ===")
 
     # Create a configuration with only branch analysis enabled
@@ -121,6 +130,8 @@ def example_specific_method():
 
 def example_config_serialization():
     """Demonstrate configuration serialization."""
+    from metagit.core.detect.models import DetectionManagerConfig
+
     print("=== Configuration Serialization ===")
 
     # Create a configuration
@@ -135,16 +146,24 @@ def example_config_serialization():
     config_dict = config.model_dump()
     print(f"Configuration as dict: {config_dict}")
 
-    # Create from dict
-    new_config = DetectionManagerConfig(**config_dict)
+    # Create from dict; the values came from a validated model, so skip re-validation
+    new_config = DetectionManagerConfig.model_construct(**config_dict)
     print(
         f"Recreated config enabled methods: {', '.join(new_config.get_enabled_methods())}"
     )
+
+    # Toggle a single flag on an existing config without re-validating
+    no_branches = new_config.copy_with(branch_analysis_enabled=False)
+    print(
+        f"Copied config enabled methods: {', '.join(no_branches.get_enabled_methods())}"
+    )
     print()
 
 
 def example_metagit_record_integration():
     """Demonstrate MetagitRecord integration."""
+    from metagit.core.detect.manager import DetectionManager
+
     print("=== MetagitRecord Integration ===")
 
     # Create DetectionManager (inherits from MetagitRecord)
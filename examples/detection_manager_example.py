@@ -218,22 +218,22 @@ def example_output_formats():
         print(summary[:200] + "..." if len(summary) > 200 else summary)
         print()
 
-    # YAML output (includes all detection data)
-    yaml_output = manager.to_yaml()
+    # YAML output (includes all detection data); only the previewed head is serialized
+    yaml_output = manager.to_yaml_preview(200)
     if isinstance(yaml_output, Exception):
         print(f"Error converting to YAML: {yaml_output}")
     else:
         print("YAML output (first 200 chars):")
-        print(yaml_output[:200] + "..." if len(yaml_output) > 200 else yaml_output)
+        print(yaml_output)
         print()
 
     # JSON output (includes all detection data)
-    json_output = manager.to_json()
+    json_output = manager.to_json_preview(200)
     if isinstance(json_output, Exception):
         print(f"Error converting to JSON: {json_output}")
     else:
         print("JSON output (first 200 chars):")
-        print(json_output[:200] + "..." if len(json_output) > 200 else json_output)
+        print(json_output)
         print()
 
 
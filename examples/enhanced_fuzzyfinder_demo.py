@@ -6,11 +6,6 @@ Example demonstrating the enhanced FuzzyFinder features:
 - Enhanced navigation (Page Up/Down, Home/End)
 """
 
-import sys
-from pathlib import Path
-
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metagit.core.utils.fuzzyfinder import FuzzyFinder, FuzzyFinderConfig
 
@@ -7,11 +7,6 @@ This shows different ways to assign colors to individual items, including:
 3. Mixed approaches and fallback behavior
 """
 
-import sys
-from pathlib import Path
-
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metagit.core.utils.fuzzyfinder import (
     FuzzyFinder,
@@ -110,6 +105,8 @@ def test_mixed_object_types():
 
     # Mix FuzzyFinderTarget objects with regular objects
     class SimpleTask:
+        __slots__ = ("name", "priority")
+
         def __init__(self, name, priority):
             self.name = name
             self.priority = priority
@@ -291,6 +288,8 @@ def test_object_items_with_colors():
 
     # Create task objects
     class Task:
+        __slots__ = ("name", "priority", "category")
+
         def __init__(self, name, priority, category):
             self.name = name
             self.priority = priority
@@ -395,6 +394,8 @@ def test_preview_with_colors():
     print("-" * 36)
 
     class ColoredItem:
+        __slots__ = ("name", "color_type", "description")
+
         def __init__(self, name, color_type, description):
             self.name = name
             self.color_type = color_type
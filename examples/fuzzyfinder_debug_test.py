@@ -5,11 +5,6 @@ Debug test script for FuzzyFinder to verify fixes.
 This script tests basic functionality with minimal configuration.
 """
 
-import sys
-from pathlib import Path
-
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metagit.core.utils.fuzzyfinder import FuzzyFinder, FuzzyFinderConfig
 
@@ -7,14 +7,9 @@ multiple fields, including a preview field that displays additional information
 when an item is selected.
 """
 
-import sys
 import traceback
-from pathlib import Path
 from typing import List
 
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from metagit.core.utils.fuzzyfinder import FuzzyFinder, FuzzyFinderConfig
 
 
@@ -4,11 +4,6 @@ Simple example showing how to use custom colors in FuzzyFinder.
 This demonstrates coloring items based on their type or priority.
 """
 
-import sys
-from pathlib import Path
-
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metagit.core.utils.fuzzyfinder import FuzzyFinder, FuzzyFinderConfig
 
@@ -69,7 +64,7 @@ def main():
         result = finder.run()
 
         if result:
-            task_type = result.split("_")[0]
+            task_type = result.partition("_")[0]
             print(f"\n✅ Selected: {result}")
             print(f"📋 Task type: {task_type}")
         else:
@@ -5,13 +5,8 @@ Simple test script demonstrating basic FuzzyFinder functionality.
 This script shows how to use the FuzzyFinder with a simple list of strings.
 """
 
-import sys
-from pathlib import Path
 from typing import List
 
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from metagit.core.utils.fuzzyfinder import FuzzyFinder, FuzzyFinderConfig
 
 
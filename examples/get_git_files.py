@@ -1,15 +1,13 @@
 #!/usr/bin/env python
 """
 List git files in a repository.
+
+Run with metagit installed (``pip install -e .`` from the repository root).
 """
 
-import sys
 from pathlib import Path
 
-# Add the metagit package to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from metagit.core.utils.files import list_git_files
+from metagit.core.utils.files import iter_git_files
 
 
 def main():
@@ -20,16 +18,22 @@ def main():
 
     print(f"Listing git files in repository: {repo_path}")
 
-    # List git files
-    git_files = list_git_files(repo_path)
-
-    if not git_files:
-        print("No git files found.")
+    # The ls-files output is read up front; only the Path objects are built lazily
+    git_files = iter_git_files(repo_path)
+    if isinstance(git_files, Exception):
+        print(f"Error: {git_files}")
         return
 
-    print(f"Found {len(git_files)} git files:")
+    count = 0
     for file in git_files:
         print(f"- {file}")
+        count += 1
+
+    if not count:
+        print("No git files found.")
+        return
+
+    print(f"Found {count} git files.")
 
 
 if __name__ == "__main__":
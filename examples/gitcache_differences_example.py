@@ -15,21 +15,32 @@ from metagit.core.gitcache import GitCacheConfig, GitCacheManager
 
 def create_test_git_repo(path: Path) -> None:
     """Create a test git repository with some commits."""
-    import os
     import subprocess
+    import time
 
-    # Initialize git repository
-    subprocess.run(["git", "init"], cwd=path, check=True)
-
-    # Create initial file
-    (path / "README.md").write_text("# Test Repository\n\nThis is a test repository.")
-    subprocess.run(["git", "add", "README.md"], cwd=path, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=path, check=True)
+    commits = [
+        ("Initial commit", "README.md", "# Test Repository\n\nThis is a test repository."),
+        ("Add main.py", "main.py", "print('Hello, World!')"),
+    ]
 
-    # Create another file
-    (path / "main.py").write_text("print('Hello, World!')")
-    subprocess.run(["git", "add", "main.py"], cwd=path, check=True)
-    subprocess.run(["git", "commit", "-m", "Add main.py"], cwd=path, check=True)
+    # Initialize git repository
+    subprocess.run(["git", "init", "--initial-branch=main"], cwd=path, check=True)
+
+    # Write both commits through a single fast-import stream instead of an add/commit pair per file
+    stamp = int(time.time())
+    stream = bytearray()
+    # Commits on the same branch within one stream chain onto each other
+    for message, file_name, content in commits:
+        (path / file_name).write_text(content)
+        data, text = content.encode(), message.encode()
+        stream += b"commit refs/heads/main\n"
+        stream += b"committer Example <example@example.com> %d +0000\n" % stamp
+        stream += b"data %d\n%s\n" % (len(text), text)
+        stream += b"M 100644 inline %s\ndata %d\n%s\n" % (file_name.encode(), len(data), data)
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input=bytes(stream), check=True)
+
+    # fast-import only writes objects and refs; sync the index with the files written above
+    subprocess.run(["git", "reset", "--quiet"], cwd=path, check=True)
 
 
 def main():
@@ -7,7 +7,10 @@ git repositories and local directories with both sync and async operations.
 """
 
 import asyncio
+import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from metagit.core.gitcache import GitCacheConfig, GitCacheManager
@@ -32,24 +35,20 @@ def create_sample_local_directory() -> Path:
     return temp_dir
 
 
-def sync_example():
+def sync_example(manager: GitCacheManager, sample_dir: Path):
     """Demonstrate synchronous git cache operations."""
     print("=== Synchronous Git Cache Example ===\n")
 
-    # Create configuration
-    config = GitCacheConfig(
-        cache_root=Path("./.metagit/.cache"),
-        default_timeout_minutes=30,
-        max_cache_size_gb=5.0,
-    )
-
-    # Create manager
-    manager = GitCacheManager(config)
+    # The clone and the local copy below are independent, so start both up front
+    # and let the network clone overlap the directory copy
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        git_future = pool.submit(manager.cache_repository, "https://github.com/octocat/Hello-World.git")
+        local_future = pool.submit(manager.cache_repository, str(sample_dir), name="sample-project")
 
     # Example 1: Cache a git repository
     print("1. Caching a git repository...")
     try:
-        entry = manager.cache_repository("https://github.com/octocat/Hello-World.git")
+        entry = git_future.result()
         if isinstance(entry, Exception):
             print(f"   Error: {entry}")
         else:
@@ -65,8 +64,7 @@ def sync_example():
     # Example 2: Cache a local directory
     print("2. Caching a local directory...")
     try:
-        sample_dir = create_sample_local_directory()
-        entry = manager.cache_repository(str(sample_dir), name="sample-project")
+        entry = local_future.result()
         if isinstance(entry, Exception):
             print(f"   Error: {entry}")
         else:
@@ -108,7 +106,8 @@ def sync_example():
             print(f"   Cache path: {cache_path}")
             if cache_path.exists():
                 print(f"   Directory exists: {cache_path.exists()}")
-                print(f"   Contents: {list(cache_path.iterdir())}")
+                with os.scandir(cache_path) as contents:
+                    print(f"   Contents: {sorted(entry.name for entry in contents)}")
     except Exception as e:
         print(f"   Error: {e}")
 
@@ -127,21 +126,10 @@ def sync_example():
         print(f"   Error: {e}")
 
 
-async def async_example():
+async def async_example(manager: GitCacheManager, sample_dir: Path):
     """Demonstrate asynchronous git cache operations."""
     print("=== Asynchronous Git Cache Example ===\n")
 
-    # Create configuration
-    config = GitCacheConfig(
-        cache_root=Path("./.metagit/.cache"),
-        default_timeout_minutes=30,
-        max_cache_size_gb=5.0,
-        enable_async=True,
-    )
-
-    # Create manager
-    manager = GitCacheManager(config)
-
     # Example 1: Cache multiple repositories concurrently
     print("1. Caching multiple repositories concurrently...")
     repositories = [
@@ -149,16 +137,15 @@ async def async_example():
         "https://github.com/octocat/Spoon-Knife.git",
     ]
 
-    tasks = []
-    for repo_url in repositories:
-        task = manager.cache_repository_async(repo_url)
-        tasks.append(task)
-
+    # The manager returns failures as Exception values instead of raising them,
+    # so one failed repository does not cancel the rest of the task group
     try:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for i, result in enumerate(results):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(manager.cache_repository_async(repo_url)) for repo_url in repositories]
+        for repo_url, task in zip(repositories, tasks, strict=True):
+            result = task.result()
             if isinstance(result, Exception):
-                print(f"   Error caching {repositories[i]}: {result}")
+                print(f"   Error caching {repo_url}: {result}")
             else:
                 print(f"   Successfully cached: {result.name}")
     except Exception as e:
@@ -169,20 +156,25 @@ async def async_example():
     # Example 2: Cache local directories concurrently
     print("2. Caching local directories concurrently...")
     try:
-        sample_dir1 = create_sample_local_directory()
-        sample_dir2 = create_sample_local_directory()
+        # Variants of the shared sample directory: the common files are hardlinked
+        # rather than written again, and only project.txt differs between them
+        sample_dir1 = sample_dir.with_name(f"{sample_dir.name}-project1")
+        sample_dir2 = sample_dir.with_name(f"{sample_dir.name}-project2")
+        shutil.copytree(sample_dir, sample_dir1, copy_function=os.link)
+        shutil.copytree(sample_dir, sample_dir2, copy_function=os.link)
 
         # Add some unique content to distinguish them
         (sample_dir1 / "project.txt").write_text("Project 1")
         (sample_dir2 / "project.txt").write_text("Project 2")
 
-        tasks = [
-            manager.cache_repository_async(str(sample_dir1), name="project1"),
-            manager.cache_repository_async(str(sample_dir2), name="project2"),
-        ]
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(manager.cache_repository_async(str(sample_dir1), name="project1")),
+                tg.create_task(manager.cache_repository_async(str(sample_dir2), name="project2")),
+            ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for i, result in enumerate(results):
+        for i, task in enumerate(tasks):
+            result = task.result()
             if isinstance(result, Exception):
                 print(f"   Error caching project{i+1}: {result}")
             else:
@@ -197,15 +189,16 @@ async def async_example():
     try:
         entries = manager.list_cache_entries()
         if entries:
-            tasks = []
-            for entry in entries[:2]:  # Refresh first 2 entries
-                task = manager.refresh_cache_entry_async(entry.name)
-                tasks.append(task)
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(manager.refresh_cache_entry_async(entry.name))
+                    for entry in entries[:2]  # Refresh first 2 entries
+                ]
+
+            for entry, task in zip(entries[:2], tasks, strict=True):
+                result = task.result()
                 if isinstance(result, Exception):
-                    print(f"   Error refreshing {entries[i].name}: {result}")
+                    print(f"   Error refreshing {entry.name}: {result}")
                 else:
                     print(f"   Successfully refreshed: {result.name}")
         else:
@@ -214,20 +207,10 @@ async def async_example():
         print(f"   Error: {e}")
 
 
-def cleanup_example():
+def cleanup_example(manager: GitCacheManager):
     """Demonstrate cache cleanup operations."""
     print("=== Cache Cleanup Example ===\n")
 
-    # Create configuration
-    config = GitCacheConfig(
-        cache_root=Path("./.metagit/.cache"),
-        default_timeout_minutes=30,
-        max_cache_size_gb=5.0,
-    )
-
-    # Create manager
-    manager = GitCacheManager(config)
-
     # Example 1: Remove specific cache entry
     print("1. Removing specific cache entry...")
     try:
@@ -259,22 +242,37 @@ def main():
     print("=" * 50)
     print()
 
+    # One manager for every example, so entries cached by the sync and async
+    # examples are the ones the cleanup example removes
+    config = GitCacheConfig(
+        cache_root=Path("./.metagit/.cache"),
+        default_timeout_minutes=30,
+        max_cache_size_gb=5.0,
+        enable_async=True,
+        # Concurrent async clones beyond this wait for a free slot
+        max_parallel_clones=4,
+    )
+    manager = GitCacheManager(config)
+
+    # One sample directory, shared by the sync and async examples
+    sample_dir = create_sample_local_directory()
+
     # Run synchronous examples
-    sync_example()
+    sync_example(manager, sample_dir)
 
     print()
     print("=" * 50)
     print()
 
     # Run asynchronous examples
-    asyncio.run(async_example())
+    asyncio.run(async_example(manager, sample_dir))
 
     print()
     print("=" * 50)
     print()
 
     # Run cleanup examples
-    cleanup_example()
+    cleanup_example(manager)
 
     print()
     print("Examples completed!")
@@ -4,17 +4,32 @@
 Example demonstrating how to load DetectionManagerConfig from YAML files.
 """
 
+import functools
 import sys
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 # Add the metagit package to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metagit.core.detect.manager import DetectionManager, DetectionManagerConfig
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml(file_path: str) -> dict:
+    """Parse a YAML configuration file once; later calls reuse the parsed sections."""
+    with open(file_path, "r") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def load_config_from_yaml(
     file_path: str, config_name: str = "default"
 ) -> DetectionManagerConfig:
@@ -29,8 +44,7 @@ def load_config_from_yaml(
         DetectionManagerConfig instance
     """
     try:
-        with open(file_path, "r") as f:
-            configs = yaml.safe_load(f)
+        configs = _load_yaml(file_path)
 
         if config_name not in configs:
             raise ValueError(f"Configuration '{config_name}' not found in {file_path}")
@@ -123,10 +137,12 @@ def example_create_yaml_config():
     # Convert to YAML
     yaml_data = {}
     for name, config in configs.items():
-        yaml_data[name] = config.model_dump()
+        yaml_data[name] = config.model_dump(exclude_defaults=True)
 
     # Print YAML
-    yaml_output = yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+    yaml_output = yaml.dump(
+        yaml_data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+    )
     print("Generated YAML configuration:")
     print(yaml_output)
 
@@ -38,9 +38,8 @@ def setup_providers_from_appconfig():
 
         registry.configure_from_app_config(app_config)
 
-        providers = registry.get_all_providers()
-        if providers:
-            provider_names = [p.get_name() for p in providers]
+        provider_names = registry.provider_names()
+        if provider_names:
             print(
                 f"✅ Configured providers from AppConfig: {', '.join(provider_names)}"
             )
@@ -60,9 +59,8 @@ def setup_providers_from_environment():
 
     registry.configure_from_environment()
 
-    providers = registry.get_all_providers()
-    if providers:
-        provider_names = [p.get_name() for p in providers]
+    provider_names = registry.provider_names()
+    if provider_names:
         print(f"✅ Configured providers from environment: {', '.join(provider_names)}")
         return True
     else:
@@ -88,9 +86,8 @@ def setup_providers_manually():
         registry.register(gitlab_provider)
         print("✅ GitLab provider configured manually")
 
-    providers = registry.get_all_providers()
-    if providers:
-        provider_names = [p.get_name() for p in providers]
+    provider_names = registry.provider_names()
+    if provider_names:
         print(f"📊 Available providers: {', '.join(provider_names)}")
         return True
     else:
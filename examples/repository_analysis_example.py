@@ -7,21 +7,64 @@ This example shows how DetectionManager now contains all the analysis results th
 previously in RepositoryAnalysis, including branch analysis, CI/CD analysis, and directory analysis.
 """
 
+import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 
 # Add the metagit package to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from metagit.core.detect import DetectionManager
+from metagit.core.detect.manager import DetectionManager, DetectionManagerConfig
+
+# Rebuild the commit-graph at most once a day; newer commits still work without it.
+COMMIT_GRAPH_MAX_AGE = 24 * 60 * 60
+
+
+def ensure_commit_graph(repo_path: str, max_age: float = COMMIT_GRAPH_MAX_AGE) -> bool:
+    """
+    Write a git commit-graph with changed-path Bloom filters for the repository.
+
+    The commit-graph is an index over existing commits, so writing it is safe and
+    idempotent: objects and refs are untouched and git falls back to the object
+    database for anything the graph does not cover. History walks (``git log``,
+    branch and metrics lookups) become much cheaper on large repositories.
+
+    Returns True when a new graph was written.
+    """
+
+    def git(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["git", "-C", repo_path, *args], capture_output=True, text=True, check=False
+        )
+
+    common_dir = git("rev-parse", "--path-format=absolute", "--git-common-dir")
+    if common_dir.returncode != 0:
+        return False
+    graph_file = Path(common_dir.stdout.strip()) / "objects" / "info" / "commit-graph"
+    if graph_file.exists() and time.time() - graph_file.stat().st_mtime < max_age:
+        return False
+
+    git("config", "--local", "core.commitGraph", "true")
+    git("config", "--local", "gc.writeCommitGraph", "true")
+    return git("commit-graph", "write", "--reachable", "--changed-paths").returncode == 0
+
+
+# Analysis results for clean checkouts, keyed on repository + HEAD commit + config
+ANALYSIS_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "metagit" / "analysis"
+)
 
 
 def example_local_repository_analysis():
     """Demonstrate analyzing a local repository with all analysis results."""
     print("=== Local Repository Analysis ===")
 
-    # Create DetectionManager for local path
-    analysis = DetectionManager.from_path("./")
+    # Create DetectionManager for local path; run_all reuses the cached result
+    # when the checkout has not changed since the last run
+    config = DetectionManagerConfig(result_cache_dir=str(ANALYSIS_CACHE_DIR))
+    analysis = DetectionManager.from_path("./", config=config)
     if isinstance(analysis, Exception):
         print(f"Error creating DetectionManager: {analysis}")
         return
@@ -30,6 +73,10 @@ def example_local_repository_analysis():
     print(f"Project name: {analysis.name}")
     print(f"Git repository: {analysis.is_git_repo}")
 
+    # Index commit history before running the git-heavy analyses
+    if ensure_commit_graph(analysis.path):
+        print("Wrote git commit-graph")
+
     # Run analysis
     result = analysis.run_all()
     if result is not None:
@@ -131,6 +178,9 @@ def example_remote_repository_analysis():
     print(f"Git repository: {analysis.is_git_repo}")
     print(f"Cloned: {analysis.is_cloned}")
 
+    # Fresh clones have no commit-graph yet
+    ensure_commit_graph(analysis.path)
+
     # Run analysis
     result = analysis.run_all()
     if result is not None:
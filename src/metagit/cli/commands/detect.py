@@ -24,9 +24,9 @@ from metagit.core.providers import registry
 from metagit.core.providers.github import GitHubProvider
 from metagit.core.providers.gitlab import GitLabProvider
 from metagit.core.utils.files import (
-    FileExtensionLookup,
     directory_details,
     directory_summary,
+    get_default_lookup,
     list_git_files,
 )
 
@@ -138,7 +138,7 @@ def detect_repo_map(ctx: click.Context, path: str, output: str) -> None:
         ctx.abort()
 
     try:
-        details = directory_details(target_path=path, file_lookup=FileExtensionLookup())
+        details = directory_details(target_path=path, file_lookup=get_default_lookup())
     except Exception as e:
         logger.error(f"Error creating directory details at {path}: {e}")
         ctx.abort()
@@ -343,9 +343,8 @@ def detect_repository(
                 logger.debug("GitLab provider configured from CLI options")
 
         # Log configured providers
-        providers = registry.get_all_providers()
-        if providers:
-            provider_names = [p.get_name() for p in providers]
+        provider_names = registry.provider_names()
+        if provider_names:
             logger.debug(f"Configured providers: {', '.join(provider_names)}")
         else:
             logger.debug("No providers configured - will use git-based metrics")
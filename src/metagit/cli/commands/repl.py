@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Run metagit commands read line by line from stdin in a single process."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+
+import click
+
+DEFAULT_DELIMITER = "__METAGIT_DONE__"
+EXIT_WORDS = frozenset({"exit", "quit"})
+
+
+def run_repl_line(root: click.Command, line: str) -> int | None:
+    """
+    Dispatch one stdin line through the root command group.
+
+    Returns the command exit code, or None when the line is blank or a comment.
+    """
+    args = shlex.split(line, comments=True)
+    if not args:
+        return None
+    try:
+        result = root.main(args, prog_name="metagit", standalone_mode=False)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    return result if isinstance(result, int) else 0
+
+
+@click.command("repl")
+@click.option(
+    "--delimiter",
+    default=DEFAULT_DELIMITER,
+    show_default=True,
+    help="Marker line printed (followed by the exit code) after each command",
+)
+@click.pass_context
+def repl_cmd(ctx: click.Context, delimiter: str) -> None:
+    """
+    Read metagit commands from stdin and run them without restarting the interpreter.
+
+    Each line is parsed like a shell command line (without the leading ``metagit``).
+    After every command a ``<delimiter> <exit-code>`` line is written to stdout so a
+    driving process knows when output for that command is complete. ``exit`` or
+    ``quit`` ends the session.
+    """
+    root = ctx.find_root().command
+    for line in sys.stdin:
+        if line.strip() in EXIT_WORDS:
+            break
+        try:
+            exit_code = run_repl_line(root, line)
+        except ValueError as e:
+            # Unbalanced quotes from shlex
+            click.echo(f"Invalid command line: {e}", err=True)
+            exit_code = 2
+        if exit_code is None:
+            continue
+        sys.stderr.flush()
+        click.echo(f"{delimiter} {exit_code}")
+        sys.stdout.flush()
@@ -44,6 +44,7 @@ from metagit.cli.commands.merge_cmd import merge_group
 from metagit.cli.commands.project import project
 from metagit.cli.commands.prompt import prompt
 from metagit.cli.commands.record import record
+from metagit.cli.commands.repl import repl_cmd
 from metagit.cli.commands.schedule import schedule_group
 from metagit.cli.commands.search import search
 from metagit.cli.commands.semantic import semantic_group
@@ -165,6 +166,7 @@ cli.add_command(completion_group)
 cli.add_command(fmt_cmd, name="fmt")
 cli.add_command(fmt_cmd, name="format")
 cli.add_command(tui_cmd, name="tui")
+cli.add_command(repl_cmd, name="repl")
 
 
 def main() -> None:
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 
+import copy
+import functools
 import os
 from enum import Enum
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -14,6 +16,18 @@ success_blurb: str = "Success! ✅"
 failure_blurb: str = "Failed! ❌"
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_file(config_path: str, mtime_ns: int, size: int) -> Any:  # noqa: ARG001
+    """
+    Parse a config file once per file version; callers must not modify the result.
+
+    mtime_ns and size are only part of the cache key. A rewrite that keeps the same
+    size within the filesystem's mtime granularity is served the stale parse.
+    """
+    with open(config_path, "r") as f:
+        return yaml.safe_load(f)
+
+
 class WorkspaceDedupeScope(str, Enum):
     """Where repository deduplication is applied."""
 
@@ -300,8 +314,10 @@ class AppConfig(BaseModel):
             if not config_file.exists():
                 return cls()
 
-            with config_file.open("r") as f:
-                config_data = yaml.safe_load(f)
+            # Reuse the parsed file while it is unchanged; validation and environment
+            # overrides still run on every load
+            stat = config_file.stat()
+            config_data = copy.deepcopy(_read_config_file(str(config_file), stat.st_mtime_ns, stat.st_size))
 
             config = cls(**config_data["config"]) if "config" in config_data else cls(**config_data)
 
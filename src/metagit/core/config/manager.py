@@ -8,8 +8,6 @@ This package provides a class for managing .metagit.yml configuration files.
 from pathlib import Path
 from typing import Optional, Union
 
-from git import Repo
-
 from metagit.core.config.models import MetagitConfig
 from metagit.core.utils.logging import LoggerConfig, UnifiedLogger
 from metagit.core.utils.yaml_class import yaml
@@ -188,6 +186,8 @@ def create_metagit_config(
     """
     logger = logger or UnifiedLogger(LoggerConfig(log_level="INFO", minimal_console=True))
     if name is None:
+        from git import Repo
+
         try:
             git_repo = Repo(Path.cwd())
             name = Path(git_repo.working_dir).name
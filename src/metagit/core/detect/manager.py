@@ -1,17 +1,36 @@
 #!/usr/bin/env python3
 
+import functools
+import glob
+import hashlib
 import importlib
+import io
 import json
 import os
 import pkgutil
+import shutil
 import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, TextIO, Union
 
 import yaml
-from git import InvalidGitRepositoryError, NoSuchPathError, Repo
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
 
 import metagit.core.detect.detectors as detectors
 from metagit.core.config.models import (
@@ -37,15 +56,89 @@ from metagit.core.detect.models import (
 from metagit.core.record.models import MetagitRecord
 from metagit.core.utils.common import normalize_git_url
 from metagit.core.utils.files import (
-    FileExtensionLookup,
     directory_details,
     directory_summary,
+    get_default_lookup,
     list_git_files,
 )
 from metagit.core.utils.logging import LoggerConfig, LoggingModel, UnifiedLogger
 
+if TYPE_CHECKING:
+    from git import Repo
+
 # from metagit.core.detect.detectors.terraform import TerraformModuleDiscovery
 
+# Human-readable names used when an analysis fails during run_all
+ANALYSIS_LABELS: Dict[str, str] = {
+    "language_detection": "Language detection",
+    "project_type_detection": "Project type detection",
+    "branch_analysis": "Branch analysis",
+    "ci_config_analysis": "CI/CD analysis",
+    "directory_summary": "Directory summary analysis",
+    "directory_details": "Directory details analysis",
+}
+
+# Language by file extension (including the dot) for language detection
+LANGUAGE_EXTENSIONS: Dict[str, str] = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".java": "Java",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".cpp": "C++",
+    ".cc": "C++",
+    ".c": "C",
+}
+
+# Package manager indicated by the presence of a file name
+PACKAGE_MANAGER_FILES: Dict[str, str] = {
+    "requirements.txt": "pip",
+    "pyproject.toml": "pip",
+    "package.json": "npm",
+    "Cargo.toml": "cargo",
+    "go.mod": "go modules",
+    "pom.xml": "maven",
+    "build.gradle": "gradle",
+}
+
+
+class _PreviewFull(Exception):
+    """Raised by _PreviewBuffer once it holds more than its limit."""
+
+
+class _PreviewBuffer(io.StringIO):
+    """Text sink that aborts the serializer writing to it once the preview is full."""
+
+    def __init__(self, max_chars: int):
+        super().__init__()
+        self.max_chars = max_chars
+
+    def write(self, s: str) -> int:
+        n = super().write(s)
+        if self.tell() > self.max_chars:
+            raise _PreviewFull
+        return n
+
+
+def _preview(write_to: Callable[[TextIO], Union[str, None, Exception]], max_chars: int) -> Union[str, Exception]:
+    """Run a stream serializer into a bounded buffer and return the truncated head."""
+    buffer = _PreviewBuffer(max_chars)
+    # to_yaml/to_json return exceptions instead of raising, including the early stop
+    result = write_to(buffer)
+    if isinstance(result, _PreviewFull):
+        return buffer.getvalue()[:max_chars] + "..."
+    if isinstance(result, Exception):
+        return result
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ci_files(source: str) -> Dict[str, str]:
+    """Load the CI file pattern to tool name mapping from a JSON data file."""
+    with open(source, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 class DetectionManager(MetagitRecord, LoggingModel):
     """
@@ -63,6 +156,16 @@ class DetectionManager(MetagitRecord, LoggingModel):
     # Internal tracking
     analysis_completed: bool = Field(default=False, description="Whether analysis has been completed")
 
+    # Git repository handle shared by all analyses of this manager
+    _repo: Any = PrivateAttr(default=None)
+
+    class Config:
+        """Pydantic configuration."""
+
+        # Fields are assigned from already-validated analysis models by the manager
+        # itself, so skip MetagitRecord's per-assignment re-validation
+        validate_assignment = False
+
     @property
     def project_path(self) -> str:
         """Get the project path."""
@@ -73,6 +176,22 @@ class DetectionManager(MetagitRecord, LoggingModel):
         """Set the project path."""
         self.path = value
 
+    def _git_repo(self) -> Optional["Repo"]:
+        """
+        Open the project's git repository once and reuse the handle.
+
+        Returns:
+            The Repo, or None if the path is not a git repository
+        """
+        if self._repo is None:
+            from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
+            try:
+                self._repo = Repo(self.path)
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                return None
+        return self._repo
+
     @classmethod
     def from_path(
         cls,
@@ -155,9 +274,20 @@ class DetectionManager(MetagitRecord, LoggingModel):
             if temp_dir is None:
                 temp_dir = tempfile.mkdtemp(prefix="metagit_")
 
-            # Clone the repository
+            # Shallow partial clone: analysis only reads the checked-out tree, HEAD and branch
+            # names, so skip the history but keep every remote branch tip for branch analysis.
+            # blob:none leaves the other tips' file contents on the server; checkout fetches
+            # just the blobs HEAD needs. Servers without filter support ignore it.
+            from git import Repo
+
             try:
-                _ = Repo.clone_from(normalized_url, temp_dir)
+                _ = Repo.clone_from(
+                    normalized_url,
+                    temp_dir,
+                    depth=1,
+                    no_single_branch=True,
+                    filter="blob:none",
+                )
                 logger.debug(f"Successfully cloned repository to: {temp_dir}")
             except Exception as e:
                 return Exception(f"Failed to clone repository: {e}")
@@ -203,13 +333,13 @@ class DetectionManager(MetagitRecord, LoggingModel):
         ]
 
         for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        config_data = yaml.safe_load(f)
-                    return MetagitConfig(**config_data)
-                except Exception:
-                    continue
+            try:
+                # Open directly rather than stat first; missing candidates are the common case
+                with open(config_path, "rb") as f:
+                    config_data = yaml.load(f, Loader=YamlLoader)
+                return MetagitConfig(**config_data)
+            except Exception:
+                continue
 
         return None
 
@@ -222,61 +352,22 @@ class DetectionManager(MetagitRecord, LoggingModel):
         """
         try:
             # Check if this is a git repository
-            try:
-                _ = Repo(self.path)
-                self.is_git_repo = True
-            except (InvalidGitRepositoryError, NoSuchPathError):
-                self.is_git_repo = False
+            self.is_git_repo = self._git_repo() is not None
 
-            self._extract_metadata()
+            # Reuse a previous result for the same clean HEAD and detection config
+            cache_file = self._result_cache_file()
+            if cache_file is not None and self._load_cached_result(cache_file):
+                self.logger.debug(f"Loaded cached analysis from {cache_file}")
+                return None
 
-            language_result = self._detect_languages()
-            if isinstance(language_result, Exception):
-                self.logger.warning(f"Language detection failed: {language_result}")
-            else:
-                self.language_detection = language_result
-
-            # Run project type detection
-            type_result = self._detect_project_type()
-            if isinstance(type_result, Exception):
-                self.logger.warning(f"Project type detection failed: {type_result}")
-            else:
-                self.project_type_detection = type_result
-
-            # Run branch analysis if enabled
-            if self.detection_config.branch_analysis_enabled and self.is_git_repo:
-                try:
-                    self.branch_analysis = GitBranchAnalysis.from_repo(self.path, self.logger)
-                    if isinstance(self.branch_analysis, Exception):
-                        self.logger.warning(f"Branch analysis failed: {self.branch_analysis}")
-                        self.branch_analysis = None
-                except Exception as e:
-                    self.logger.warning(f"Branch analysis failed: {e}")
-
-            # Run CI/CD analysis if enabled
-            if self.detection_config.ci_config_analysis_enabled:
-                try:
-                    self.ci_config_analysis = self._ci_config_analysis()
-                    if isinstance(self.ci_config_analysis, Exception):
-                        self.logger.warning(f"CI/CD analysis failed: {self.ci_config_analysis}")
-                        self.ci_config_analysis = None
-                except Exception as e:
-                    self.logger.warning(f"CI/CD analysis failed: {e}")
-
-            # Run directory summary analysis if enabled
-            if self.detection_config.directory_summary_enabled:
-                try:
-                    self.directory_summary = directory_summary(self.path)
-                except Exception as e:
-                    self.logger.warning(f"Directory summary analysis failed: {e}")
+            self._extract_metadata()
 
-            # Run directory details analysis if enabled
-            if self.detection_config.directory_details_enabled:
-                try:
-                    file_lookup = FileExtensionLookup()
-                    self.directory_details = directory_details(self.path, file_lookup)
-                except Exception as e:
-                    self.logger.warning(f"Directory details analysis failed: {e}")
+            # Independent analyses run concurrently; results are assigned here on the calling thread
+            for method_name, result in self._run_analyses_concurrently().items():
+                if isinstance(result, Exception):
+                    self.logger.warning(f"{ANALYSIS_LABELS[method_name]} failed: {result}")
+                    continue
+                setattr(self, method_name, result)
 
             # Analyze files
             self._analyze_files()
@@ -288,12 +379,143 @@ class DetectionManager(MetagitRecord, LoggingModel):
             self._update_metagit_record()
 
             self.analysis_completed = True
+            if cache_file is not None:
+                self._store_cached_result(cache_file)
             self.logger.debug("All analysis methods completed successfully")
             return None
 
         except Exception as e:
             return e
 
+    # Fields that describe where and how the analysis ran rather than its result
+    _CACHE_EXCLUDED_FIELDS: ClassVar[frozenset[str]] = frozenset({"path", "temp_dir", "is_cloned", "detection_config"})
+
+    def _result_cache_file(self) -> Optional[Path]:
+        """
+        Get the run_all cache file for the current repository state.
+
+        The key covers the resolved path, the HEAD commit and the detection config, so a
+        new commit, checkout or config change selects a different entry. Working trees
+        with any uncommitted, untracked or gitignored files are never cached, since the
+        analysis walks those files but HEAD does not describe them.
+
+        Returns:
+            Path of the cache file, or None if caching is disabled or not possible
+        """
+        cache_dir = self.detection_config.result_cache_dir
+        if not cache_dir or not self.is_git_repo:
+            return None
+        try:
+            repo = self._git_repo()
+            # One status call covers staged, unstaged, untracked and ignored files; is_dirty() runs three.
+            # Ignored files count even under prune_dirs: _analyze_files globs into those directories.
+            if repo is None or repo.git.status("--porcelain", "--untracked-files=normal", "--ignored"):
+                return None
+            head = repo.head.commit.hexsha
+        except Exception:
+            # No commits yet or git failed
+            return None
+        config_data = self.detection_config.model_dump(mode="json", exclude={"result_cache_dir"})
+        # Sets dump in hash order, which varies between processes; sort so the key is stable
+        config_data["prune_dirs"] = sorted(config_data["prune_dirs"])
+        key_data = {
+            "path": str(Path(self.path).resolve()),
+            "head": head,
+            "config": config_data,
+        }
+        key = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+        return Path(cache_dir) / f"{key}.json"
+
+    def _load_cached_result(self, cache_file: Path) -> bool:
+        """Copy analysis results from a cache file onto this manager; returns True on a hit."""
+        try:
+            cached = type(self).model_validate_json(cache_file.read_bytes())
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable analysis cache {cache_file}: {e}")
+            return False
+        for name in type(self).model_fields:
+            if name not in self._CACHE_EXCLUDED_FIELDS:
+                setattr(self, name, getattr(cached, name))
+        return True
+
+    def _store_cached_result(self, cache_file: Path) -> None:
+        """Atomically write the analysis results to a cache file."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(self.model_dump_json(exclude=set(self._CACHE_EXCLUDED_FIELDS)))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.warning(f"Failed to write analysis cache {cache_file}: {e}")
+
+    def _analysis_task(self, method_name: str) -> Optional[Callable[[], Any]]:
+        """
+        Get the callable that computes a single analysis without assigning it.
+
+        Returns:
+            A zero-argument callable, or None if the method has no implementation yet
+        """
+        if method_name == "language_detection":
+            return self._detect_languages
+        if method_name == "project_type_detection":
+            return self._detect_project_type
+        if method_name == "branch_analysis":
+            return partial(self._branch_analysis, self.path)
+        if method_name == "ci_config_analysis":
+            return self._ci_config_analysis
+        prune_dirs = self.detection_config.prune_dirs
+        if method_name == "directory_summary":
+            return partial(directory_summary, self.path, prune_dirs=prune_dirs)
+        if method_name == "directory_details":
+            return partial(directory_details, self.path, get_default_lookup(), prune_dirs=prune_dirs)
+        return None
+
+    def _analysis_tasks(self) -> Dict[str, Callable[[], Any]]:
+        """Build the independent analysis callables enabled by the detection config."""
+        tasks: Dict[str, Callable[[], Any]] = {
+            "language_detection": self._detect_languages,
+            "project_type_detection": self._detect_project_type,
+        }
+        for method_name in self.detection_config.enabled_methods:
+            if method_name == "branch_analysis" and not self.is_git_repo:
+                continue
+            task = self._analysis_task(method_name)
+            if task is None:
+                # commit_analysis and tag_analysis are configurable but not implemented yet
+                self.logger.debug(f"Skipping unimplemented analysis method: {method_name}")
+                continue
+            tasks[method_name] = task
+        return tasks
+
+    def _run_analyses_concurrently(self) -> Dict[str, Any]:
+        """
+        Run the enabled analyses in a thread pool.
+
+        The analyses only read the repository (filesystem walks and git calls), so they
+        can overlap; none of them mutate the manager.
+
+        Returns:
+            Mapping of method name to its result or the Exception it produced
+        """
+        tasks = self._analysis_tasks()
+        results: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="metagit-detect") as executor:
+            futures = {executor.submit(task): method_name for method_name, task in tasks.items()}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+        # Keep a stable order regardless of completion order
+        return {method_name: results[method_name] for method_name in tasks}
+
     def run_specific(self, method_name: str) -> Union[None, Exception]:
         """
         Run a specific analysis method.
@@ -307,44 +529,18 @@ class DetectionManager(MetagitRecord, LoggingModel):
         try:
             self.logger.debug(f"Running specific analysis method: {method_name}")
 
-            if method_name == "language_detection":
-                result = self._detect_languages()
-                if isinstance(result, Exception):
-                    return result
-                self.language_detection = result
-
-            elif method_name == "project_type_detection":
-                result = self._detect_project_type()
-                if isinstance(result, Exception):
-                    return result
-                self.project_type_detection = result
-
-            elif method_name == "branch_analysis":
-                if not self.is_git_repo:
-                    return Exception("Branch analysis requires a git repository")
-                result = GitBranchAnalysis.from_repo(self.path, self.logger)
-                if isinstance(result, Exception):
-                    return result
-                self.branch_analysis = result
-
-            elif method_name == "ci_config_analysis":
-                result = self._ci_config_analysis()
-                if isinstance(result, Exception):
-                    return result
-                self.ci_config_analysis = result
-
-            elif method_name == "directory_summary":
-                result = directory_summary(self.path)
-                self.directory_summary = result
+            if method_name == "branch_analysis" and not self.is_git_repo:
+                return Exception("Branch analysis requires a git repository")
 
-            elif method_name == "directory_details":
-                file_lookup = FileExtensionLookup()
-                result = directory_details(self.path, file_lookup)
-                self.directory_details = result
-
-            else:
+            task = self._analysis_task(method_name)
+            if task is None:
                 return Exception(f"Unknown analysis method: {method_name}")
 
+            result = task()
+            if isinstance(result, Exception):
+                return result
+            setattr(self, method_name, result)
+
             # Update MetagitRecord fields
             self._update_metagit_record()
 
@@ -367,15 +563,15 @@ class DetectionManager(MetagitRecord, LoggingModel):
                 readme_path = Path(self.path) / readme_file
                 if readme_path.exists():
                     try:
-                        with open(readme_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            # Extract first line as description
-                            lines = content.split("\n")
-                            for line in lines:
-                                line = line.strip()
-                                if line and not line.startswith("#"):
-                                    self.description = line[:200]  # Limit to 200 chars
-                                    break
+                        content = self._read_text_if_small(readme_path)
+                        if content is None:
+                            break
+                        # Extract first line as description
+                        for line in content.split("\n"):
+                            line = line.strip()
+                            if line and not line.startswith("#"):
+                                self.description = line[:200]  # Limit to 200 chars
+                                break
                     except Exception:
                         continue
                     break
@@ -383,55 +579,56 @@ class DetectionManager(MetagitRecord, LoggingModel):
         except Exception as e:
             self.logger.warning(f"Metadata extraction failed: {e}")
 
+    def _read_text_if_small(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Read a text file unless it exceeds the configured large file threshold.
+
+        Large files are only stat'ed, so oversized READMEs or generated CI configs
+        never cost a full content read.
+
+        Returns:
+            File content, or None if the file is larger than the threshold
+        """
+        st = os.stat(file_path)
+        if st.st_size > self.detection_config.large_file_threshold_bytes:
+            self.logger.debug(
+                f"Skipping content read of large file {file_path} "
+                f"(size={st.st_size}, mtime_ns={st.st_mtime_ns}, mode={oct(st.st_mode)})"
+            )
+            return None
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+
     def _detect_languages(self) -> Union[LanguageDetection, Exception]:
         """Detect programming languages in the repository."""
         try:
             # This is a simplified language detection
             # In a real implementation, you would use more sophisticated detection
-            detected_languages = []
             frameworks = []
-            package_managers = []
             build_tools = []
 
-            # Check for common file extensions
-            for _root, _dirs, files in os.walk(self.path):
+            # One dict lookup per file name instead of a chain of suffix checks
+            language_counts: Counter[str] = Counter()
+            package_manager_set = set()
+            prune_dirs = self.detection_config.prune_dirs
+            for _root, dirs, files in os.walk(self.path):
+                dirs[:] = [d for d in dirs if d != ".git" and d not in prune_dirs]
                 for file in files:
-                    if file.endswith(".py"):
-                        detected_languages.append("Python")
-                    elif file.endswith(".js"):
-                        detected_languages.append("JavaScript")
-                    elif file.endswith(".ts"):
-                        detected_languages.append("TypeScript")
-                    elif file.endswith(".java"):
-                        detected_languages.append("Java")
-                    elif file.endswith(".go"):
-                        detected_languages.append("Go")
-                    elif file.endswith(".rs"):
-                        detected_languages.append("Rust")
-                    elif file.endswith(".cpp") or file.endswith(".cc"):
-                        detected_languages.append("C++")
-                    elif file.endswith(".c"):
-                        detected_languages.append("C")
-
-                # Check for framework and tool indicators
-                if "requirements.txt" in files or "pyproject.toml" in files:
-                    package_managers.append("pip")
-                if "package.json" in files:
-                    package_managers.append("npm")
-                if "Cargo.toml" in files:
-                    package_managers.append("cargo")
-                if "go.mod" in files:
-                    package_managers.append("go modules")
-                if "pom.xml" in files:
-                    package_managers.append("maven")
-                if "build.gradle" in files:
-                    package_managers.append("gradle")
-            package_managers = list(set(package_managers))
+                    dot = file.rfind(".")
+                    if dot >= 0:
+                        language = LANGUAGE_EXTENSIONS.get(file[dot:])
+                        if language:
+                            language_counts[language] += 1
+                    # Check for framework and tool indicators
+                    package_manager = PACKAGE_MANAGER_FILES.get(file)
+                    if package_manager:
+                        package_manager_set.add(package_manager)
+            package_managers = list(package_manager_set)
 
             # Determine primary language (most common)
-            if detected_languages:
-                primary = max(set(detected_languages), key=detected_languages.count)
-                secondary = list(set(detected_languages) - {primary})
+            if language_counts:
+                primary = language_counts.most_common(1)[0][0]
+                secondary = [language for language in language_counts if language != primary]
             else:
                 primary = "Unknown"
                 secondary = []
@@ -511,11 +708,10 @@ class DetectionManager(MetagitRecord, LoggingModel):
     def _detect_metrics(self) -> None:
         """Detect repository metrics."""
         try:
-            if not self.is_git_repo:
+            repo = self._git_repo() if self.is_git_repo else None
+            if repo is None:
                 return
 
-            repo = Repo(self.path)
-
             # Create metrics object
             self.metrics = Metrics(
                 stars=0,  # Would be fetched from provider API
@@ -640,74 +836,88 @@ class DetectionManager(MetagitRecord, LoggingModel):
         except Exception as e:
             return e
 
-    def to_yaml(self) -> Union[str, Exception]:
+    def _serializable_data(self) -> Dict[str, Any]:
+        """Dump the manager to plain data that YAML and JSON can both serialize."""
+        data = self.model_dump(exclude_none=True, exclude_defaults=True)
+
+        # Handle complex objects that can't be serialized directly
+        def convert_objects(obj):
+            if hasattr(obj, "model_dump"):
+                return obj.model_dump()
+            elif isinstance(obj, datetime):
+                return obj.isoformat()
+            elif isinstance(obj, Path):
+                return str(obj)
+            return obj
+
+        # Convert nested objects
+        for key, value in data.items():
+            if isinstance(value, dict):
+                data[key] = {k: convert_objects(v) for k, v in value.items()}
+            elif isinstance(value, list):
+                data[key] = [convert_objects(v) for v in value]
+            else:
+                data[key] = convert_objects(value)
+        return data
+
+    def to_yaml(self, stream: Optional[TextIO] = None) -> Union[str, None, Exception]:
         """
-        Convert DetectionManager to YAML string.
+        Convert DetectionManager to YAML.
+
+        Args:
+            stream: Optional text stream to write to instead of building a string
 
         Returns:
-            YAML string or Exception
+            YAML string (None when written to stream) or Exception
         """
         try:
-            data = self.model_dump(exclude_none=True, exclude_defaults=True)
-
-            # Handle complex objects that can't be serialized directly
-            def convert_objects(obj):
-                if hasattr(obj, "model_dump"):
-                    return obj.model_dump()
-                elif isinstance(obj, datetime):
-                    return obj.isoformat()
-                elif isinstance(obj, Path):
-                    return str(obj)
-                return obj
-
-            # Convert nested objects
-            for key, value in data.items():
-                if isinstance(value, dict):
-                    data[key] = {k: convert_objects(v) for k, v in value.items()}
-                elif isinstance(value, list):
-                    data[key] = [convert_objects(v) for v in value]
-                else:
-                    data[key] = convert_objects(value)
-
-            return yaml.safe_dump(data, indent=2, default_flow_style=False)
-
+            return yaml.dump(self._serializable_data(), stream, Dumper=YamlDumper, indent=2, default_flow_style=False)
         except Exception as e:
             return e
 
-    def to_json(self) -> Union[str, Exception]:
+    def to_json(self, stream: Optional[TextIO] = None) -> Union[str, None, Exception]:
         """
-        Convert DetectionManager to JSON string.
+        Convert DetectionManager to JSON.
+
+        Args:
+            stream: Optional text stream to write to instead of building a string
 
         Returns:
-            JSON string or Exception
+            JSON string (None when written to stream) or Exception
         """
         try:
-            data = self.model_dump(exclude_none=True, exclude_defaults=True)
-
-            # Handle complex objects that can't be serialized directly
-            def convert_objects(obj):
-                if hasattr(obj, "model_dump"):
-                    return obj.model_dump()
-                elif isinstance(obj, datetime):
-                    return obj.isoformat()
-                elif isinstance(obj, Path):
-                    return str(obj)
-                return obj
-
-            # Convert nested objects
-            for key, value in data.items():
-                if isinstance(value, dict):
-                    data[key] = {k: convert_objects(v) for k, v in value.items()}
-                elif isinstance(value, list):
-                    data[key] = [convert_objects(v) for v in value]
-                else:
-                    data[key] = convert_objects(value)
-
-            return json.dumps(data, indent=2, default=str)
-
+            data = self._serializable_data()
+            if orjson is not None:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                text = orjson.dumps(data, default=str, option=options).decode("utf-8")
+                if stream is None:
+                    return text
+                stream.write(text)
+                return None
+            if stream is None:
+                return json.dumps(data, indent=2, default=str)
+            json.dump(data, stream, indent=2, default=str)
+            return None
         except Exception as e:
             return e
 
+    def to_yaml_preview(self, max_chars: int = 200) -> Union[str, Exception]:
+        """
+        Get the first max_chars characters of the YAML output, followed by "..." if truncated.
+
+        Serialization stops as soon as enough output has been produced.
+        """
+        return _preview(self.to_yaml, max_chars)
+
+    def to_json_preview(self, max_chars: int = 200) -> Union[str, Exception]:
+        """
+        Get the first max_chars characters of the JSON output, followed by "..." if truncated.
+
+        With orjson installed the whole document is serialized before truncating; the
+        stdlib fallback stops as soon as enough output has been produced.
+        """
+        return _preview(self.to_json, max_chars)
+
     def _ci_config_analysis(self, repo_path: str = None) -> Union[CIConfigAnalysis, Exception]:
         """
         Analyze CI/CD configuration in the repository.
@@ -730,30 +940,36 @@ class DetectionManager(MetagitRecord, LoggingModel):
         try:
             analysis = CIConfigAnalysis()
 
-            # Check for common CI/CD configuration files
-            ci_files = self.detection_config.data_ci_file_source
-
-            for file_path, tool_name in ci_files.items():
-                full_path = os.path.join(repo_path_obj, file_path)
-                if full_path.exists():
-                    analysis.detected_tool = tool_name
-                    analysis.ci_config_path = str(full_path)
-
-                    # Read configuration content
-                    if full_path.is_dir():
-                        for file in full_path.iterdir():
-                            if file.is_file():
-                                with open(file, "r", encoding="utf-8") as f:
-                                    analysis.config_content = f.read()
-                    else:
-                        try:
-                            with open(full_path, "r", encoding="utf-8") as f:
-                                analysis.config_content = f.read()
-                        except Exception as e:
-                            self.logger.warning(f"Could not read CI config file {full_path}: {e}")
-
-                    self.logger.debug(f"Detected CI/CD tool: {tool_name}")
-                    break
+            # Check for common CI/CD configuration files, in data file order
+            ci_files = _load_ci_files(self.detection_config.data_ci_file_source)
+
+            for file_pattern, tool_name in ci_files.items():
+                if glob.has_magic(file_pattern):
+                    matches = sorted(p for p in repo_path_obj.glob(file_pattern) if p.is_file())
+                else:
+                    candidate = repo_path_obj / file_pattern
+                    matches = [candidate] if candidate.is_file() else []
+                if not matches:
+                    continue
+
+                analysis.detected_tool = tool_name
+                analysis.ci_config_path = str(matches[0])
+
+                # Read configuration content; every matching file counts towards the pipelines
+                contents = []
+                for match in matches:
+                    try:
+                        content = self._read_text_if_small(match)
+                    except Exception as e:
+                        self.logger.warning(f"Could not read CI config file {match}: {e}")
+                        continue
+                    if content is not None:
+                        contents.append(content)
+                if contents:
+                    analysis.config_content = "\n".join(contents)
+
+                self.logger.debug(f"Detected CI/CD tool: {tool_name}")
+                break
 
             # Count pipelines (basic heuristic)
             if analysis.config_content:
@@ -785,8 +1001,12 @@ class DetectionManager(MetagitRecord, LoggingModel):
           - Should replace GitPython with a more lightweight library
         """
 
+        from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
         try:
-            repo = Repo(repo_path)
+            repo = self._git_repo() if repo_path == self.path else None
+            if repo is None:
+                repo = Repo(repo_path)
         except (InvalidGitRepositoryError, NoSuchPathError) as e:
             self.logger.exception(f"Invalid git repository at '{repo_path}': {e}")
             return ValueError(f"Invalid git repository at '{repo_path}': {e}")
@@ -867,14 +1087,18 @@ class DetectionManager(MetagitRecord, LoggingModel):
 
         return BranchStrategy.UNKNOWN
 
-    # def cleanup(self) -> None:
-    #     """Clean up temporary files if this was a cloned repository."""
-    #     if self.is_cloned and self.temp_dir and os.path.exists(self.temp_dir):
-    #         try:
-    #             shutil.rmtree(self.temp_dir)
-    #             self.logger.debug(f"Cleaned up temporary directory: {self.temp_dir}")
-    #         except Exception as e:
-    #             self.logger.warning(f"Failed to clean up temporary directory: {e}")
+    def cleanup(self) -> None:
+        """Clean up temporary files if this was a cloned repository."""
+        if self._repo is not None:
+            # Stop the git cat-file processes GitPython keeps alive for the handle
+            self._repo.close()
+            self._repo = None
+        if self.is_cloned and self.temp_dir and os.path.exists(self.temp_dir):
+            try:
+                shutil.rmtree(self.temp_dir)
+                self.logger.debug(f"Cleaned up temporary directory: {self.temp_dir}")
+            except Exception as e:
+                self.logger.warning(f"Failed to clean up temporary directory: {e}")
 
 
 # class ProjectDiscovery(Protocol):
@@ -10,12 +10,13 @@ and detection manager configuration.
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, List, Optional, Protocol, runtime_checkable
+from typing import Any, ClassVar, FrozenSet, List, Optional, Protocol, runtime_checkable
 
 from pydantic import BaseModel, Field
 
 from metagit import DATA_PATH
 from metagit.core.config.models import ProjectDomain, ProjectType
+from metagit.core.utils.files import DEFAULT_PRUNE_DIRS
 from metagit.core.utils.logging import LoggingModel
 
 
@@ -250,6 +251,19 @@ class DetectionManagerConfig(BaseModel):
     # Future analysis methods
     commit_analysis_enabled: bool = Field(default=False, description="Enable Git commit analysis")
     tag_analysis_enabled: bool = Field(default=False, description="Enable Git tag analysis")
+    large_file_threshold_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=0,
+        description="Files larger than this are identified by stat metadata only and never read",
+    )
+    prune_dirs: FrozenSet[str] = Field(
+        default=DEFAULT_PRUNE_DIRS,
+        description="Directory names skipped by directory and language analysis walks",
+    )
+    result_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached run_all results of clean git checkouts (disabled when unset)",
+    )
     data_file_type_source: Optional[str] = Field(
         default=os.path.join(DATA_PATH, "file-types.json"),
         description="Source of data file types",
@@ -291,22 +305,36 @@ class DetectionManagerConfig(BaseModel):
             tag_analysis_enabled=False,
         )
 
+    def copy_with(self, **updates: Any) -> "DetectionManagerConfig":
+        """
+        Return a copy with the given fields replaced, without re-running validation.
+
+        Intended for toggling analysis flags on an already validated configuration,
+        e.g. ``config.copy_with(branch_analysis_enabled=False)``.
+        """
+        unknown = set(updates) - set(type(self).model_fields)
+        if unknown:
+            raise ValueError(f"Unknown DetectionManagerConfig field(s): {', '.join(sorted(unknown))}")
+        return self.model_copy(update=updates)
+
+    # Analysis method names in run order; each is toggled by a ``<name>_enabled`` field.
+    ANALYSIS_METHODS: ClassVar[tuple[str, ...]] = (
+        "branch_analysis",
+        "ci_config_analysis",
+        "directory_summary",
+        "directory_details",
+        "commit_analysis",
+        "tag_analysis",
+    )
+
+    @property
+    def enabled_methods(self) -> tuple[str, ...]:
+        """Enabled analysis method names in run order."""
+        return tuple(name for name in self.ANALYSIS_METHODS if getattr(self, f"{name}_enabled"))
+
     def get_enabled_methods(self) -> list[str]:
         """Get a list of enabled analysis method names."""
-        enabled = []
-        if self.branch_analysis_enabled:
-            enabled.append("branch_analysis")
-        if self.ci_config_analysis_enabled:
-            enabled.append("ci_config_analysis")
-        if self.directory_summary_enabled:
-            enabled.append("directory_summary")
-        if self.directory_details_enabled:
-            enabled.append("directory_details")
-        if self.commit_analysis_enabled:
-            enabled.append("commit_analysis")
-        if self.tag_analysis_enabled:
-            enabled.append("tag_analysis")
-        return enabled
+        return list(self.enabled_methods)
 
 
 class DiscoveryResult(BaseModel):
@@ -6,6 +6,8 @@ This module defines the Pydantic models used for configuring
 the git cache management system.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -14,6 +16,32 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+def directory_size_bytes(path: Path) -> int:
+    """
+    Sum the sizes of all files below a directory.
+
+    Uses os.scandir so file type and size come from the directory listing
+    instead of a Path object and extra stat call per file. Symlinked
+    directories are not followed; symlinked files count with their target size.
+    """
+    total_size = 0
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total_size
+
+
 class CacheType(str, Enum):
     """Enumeration of cache types."""
 
@@ -79,6 +107,7 @@ class GitCacheConfig(BaseModel):
     default_timeout_minutes: int = Field(default=60, description="Default cache timeout in minutes")
     max_cache_size_gb: float = Field(default=10.0, description="Maximum cache size in GB")
     enable_async: bool = Field(default=True, description="Enable async operations")
+    max_parallel_clones: int = Field(default=4, description="Maximum concurrent clones for async operations")
     git_config: Dict[str, Any] = Field(default_factory=dict, description="Git configuration options")
     provider_config: Optional[Dict[str, Any]] = Field(None, description="Provider-specific configuration")
     entries: Dict[str, GitCacheEntry] = Field(default_factory=dict, description="Cache entries")
@@ -101,6 +130,14 @@ class GitCacheConfig(BaseModel):
             raise ValueError("Timeout must be positive")
         return v
 
+    @field_validator("max_parallel_clones")
+    @classmethod
+    def validate_max_parallel_clones(cls, v: int) -> int:
+        """Validate the clone limit is positive."""
+        if v <= 0:
+            raise ValueError("Max parallel clones must be positive")
+        return v
+
     @field_validator("max_cache_size_gb")
     @classmethod
     def validate_max_size(cls, v: float) -> float:
@@ -120,14 +157,12 @@ class GitCacheConfig(BaseModel):
 
     def get_cache_size_bytes(self) -> int:
         """Get total cache size in bytes."""
-        total_size = 0
-        for entry in self.entries.values():
-            if entry.cache_path.exists():
-                try:
-                    total_size += sum(f.stat().st_size for f in entry.cache_path.rglob("*") if f.is_file())
-                except (OSError, PermissionError):
-                    continue
-        return total_size
+        paths = [entry.cache_path for entry in self.entries.values() if entry.cache_path.exists()]
+        if len(paths) <= 1:
+            return sum(directory_size_bytes(path) for path in paths)
+        # Directory walks are I/O bound, so entries are measured concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return sum(executor.map(directory_size_bytes, paths))
 
     def get_cache_size_gb(self) -> float:
         """Get total cache size in GB."""
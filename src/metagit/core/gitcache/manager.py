@@ -8,10 +8,12 @@ for caching git repositories and local directories.
 
 import asyncio
 import logging
+import os
 import shutil
+import stat
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import git  # Add this at the top with other imports
 
@@ -20,13 +22,45 @@ from metagit.core.gitcache.config import (
     CacheType,
     GitCacheConfig,
     GitCacheEntry,
+    directory_size_bytes,
 )
 from metagit.core.providers.base import GitProvider
 from metagit.core.utils.common import normalize_git_url
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _reflink_copy_function() -> Callable[[str, str], str]:
+    """
+    Build a shutil.copytree copy function that clones files copy-on-write when it can.
+
+    On filesystems with reflinks (Btrfs, XFS, ...) the cached copy shares the source's
+    data blocks, so no file contents are written, yet it stays independent of later
+    edits to the source. After the first refusal every file is copied with copy2, as is
+    anything that is not a regular file (opening a named pipe would block forever).
+    """
+    reflink = fcntl is not None and hasattr(fcntl, "FICLONE")
+
+    def _copy(src: str, dst: str) -> str:
+        nonlocal reflink
+        if reflink and stat.S_ISREG(os.stat(src).st_mode):
+            try:
+                with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                    fcntl.ioctl(dst_file.fileno(), fcntl.FICLONE, src_file.fileno())
+                shutil.copystat(src, dst)
+                return dst
+            except OSError:
+                reflink = False
+        return shutil.copy2(src, dst)
+
+    return _copy
+
+
 class GitCacheManager:
     """Manager for git cache operations."""
 
@@ -39,6 +73,9 @@ class GitCacheManager:
         """
         self.config = config
         self._providers: Dict[str, GitProvider] = {}
+        # Caps concurrent async clones; created on first use so it belongs to the running loop
+        self._clone_semaphore: Optional[asyncio.Semaphore] = None
+        self._clone_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def register_provider(self, provider: GitProvider) -> None:
         """
@@ -181,11 +218,20 @@ class GitCacheManager:
             True if successful, Exception if failed
         """
         try:
-            result = await asyncio.to_thread(self._clone_repository, url, cache_path)
+            async with self._get_clone_semaphore():
+                result = await asyncio.to_thread(self._clone_repository, url, cache_path)
             return result
         except Exception as e:
             return Exception(f"Git clone error (async): {str(e)}")
 
+    def _get_clone_semaphore(self) -> asyncio.Semaphore:
+        """Return the clone limiter for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._clone_semaphore is None or self._clone_semaphore_loop is not loop:
+            self._clone_semaphore = asyncio.Semaphore(self.config.max_parallel_clones)
+            self._clone_semaphore_loop = loop
+        return self._clone_semaphore
+
     def _copy_local_directory(self, source_path: Path, cache_path: Path) -> Union[bool, Exception]:
         """
         Copy a local directory to cache.
@@ -202,8 +248,8 @@ class GitCacheManager:
             if cache_path.exists():
                 shutil.rmtree(cache_path)
 
-            # Copy directory
-            shutil.copytree(source_path, cache_path)
+            # Copy directory, sharing file data with the source where the filesystem allows
+            shutil.copytree(source_path, cache_path, copy_function=_reflink_copy_function())
 
             logger.info(f"Successfully copied local directory: {source_path}")
             return True
@@ -277,14 +323,7 @@ class GitCacheManager:
         Returns:
             Size in bytes
         """
-        total_size = 0
-        try:
-            for file_path in path.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-        except (OSError, PermissionError):
-            pass
-        return total_size
+        return directory_size_bytes(path)
 
     def cache_repository(self, source: str, name: Optional[str] = None) -> Union[GitCacheEntry, Exception]:
         """
@@ -435,7 +474,7 @@ class GitCacheManager:
             if existing_entry and cache_path.exists():
                 if cache_type == CacheType.GIT:
                     # Check for differences before pulling updates
-                    diff_info = self._check_repository_differences(cache_path)
+                    diff_info = await self._check_repository_differences_async(cache_path)
 
                     # Update entry with difference information
                     existing_entry.local_commit_hash = diff_info["local_info"]["commit_hash"]
@@ -503,7 +542,7 @@ class GitCacheManager:
 
             # For git repositories, populate git information
             if cache_type == CacheType.GIT:
-                diff_info = self._check_repository_differences(cache_path)
+                diff_info = await self._check_repository_differences_async(cache_path)
                 entry.local_commit_hash = diff_info["local_info"]["commit_hash"]
                 entry.local_branch = diff_info["local_info"]["branch"]
                 entry.remote_commit_hash = diff_info["remote_info"]["commit_hash"]
@@ -669,8 +708,9 @@ class GitCacheManager:
         missing_entries = sum(1 for e in entries if e.status == CacheStatus.MISSING)
         error_entries = sum(1 for e in entries if e.status == CacheStatus.ERROR)
 
+        # Walk the cache once; the GB figure and the full check derive from it
         total_size_bytes = self.config.get_cache_size_bytes()
-        total_size_gb = self.config.get_cache_size_gb()
+        total_size_gb = total_size_bytes / (1024**3)
 
         return {
             "total_entries": total_entries,
@@ -683,7 +723,7 @@ class GitCacheManager:
             "total_size_bytes": total_size_bytes,
             "total_size_gb": total_size_gb,
             "max_size_gb": self.config.max_cache_size_gb,
-            "cache_full": self.config.is_cache_full(),
+            "cache_full": total_size_gb >= self.config.max_cache_size_gb,
         }
 
     def _get_repository_info(self, repo_path: Path) -> Dict[str, Any]:
@@ -742,7 +782,13 @@ class GitCacheManager:
             default_branch = None
             try:
                 # Try to get default branch from remote
-                default_branch = repo.git.remote("show", remote_name).split("\n")[2].split(":")[1].strip()
+                for line in repo.git.remote("show", remote_name).splitlines():
+                    key, _, value = line.strip().partition(":")
+                    if key == "HEAD branch" and value.strip() != "(unknown)":
+                        default_branch = value.strip()
+                        break
+                else:
+                    raise ValueError("remote HEAD branch not reported")
             except Exception as e:
                 logger.warning(f"Failed to get default branch for {repo_path}: {e}")
                 # Fallback to common default branches
@@ -779,14 +825,45 @@ class GitCacheManager:
         Returns:
             Dictionary with difference information
         """
-        try:
-            repo = git.Repo(repo_path)
+        local_info = self._get_repository_info(repo_path)
+        remote_info = self._get_remote_info(repo_path)
+        return self._compare_repository_info(repo_path, local_info, remote_info)
 
-            # Get local info
-            local_info = self._get_repository_info(repo_path)
+    async def _check_repository_differences_async(self, repo_path: Path) -> Dict[str, Any]:
+        """
+        Check for differences between local and remote repositories asynchronously.
 
-            # Get remote info
-            remote_info = self._get_remote_info(repo_path)
+        The local HEAD lookup and the remote fetch do not depend on each other,
+        so they run concurrently in worker threads.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            Dictionary with difference information
+        """
+        local_info, remote_info = await asyncio.gather(
+            asyncio.to_thread(self._get_repository_info, repo_path),
+            asyncio.to_thread(self._get_remote_info, repo_path),
+        )
+        return await asyncio.to_thread(self._compare_repository_info, repo_path, local_info, remote_info)
+
+    def _compare_repository_info(
+        self, repo_path: Path, local_info: Dict[str, Any], remote_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Compare local and remote repository information.
+
+        Args:
+            repo_path: Path to the git repository
+            local_info: Result of _get_repository_info
+            remote_info: Result of _get_remote_info
+
+        Returns:
+            Dictionary with difference information
+        """
+        try:
+            repo = git.Repo(repo_path)
 
             # Check if there are differences
             has_changes = False
@@ -805,16 +882,17 @@ class GitCacheManager:
                     local_commit = repo.commit(local_info["commit_hash"])
                     remote_commit = repo.commit(remote_info["commit_hash"])
 
-                    # Get commits ahead and behind
-                    ahead_commits = list(repo.iter_commits(f"{local_commit.hexsha}..{remote_commit.hexsha}"))
-                    behind_commits = list(repo.iter_commits(f"{remote_commit.hexsha}..{local_commit.hexsha}"))
+                    # Count commits on each side of the symmetric difference in a single history walk
+                    counts = repo.git.rev_list(
+                        "--left-right", "--count", f"{local_commit.hexsha}...{remote_commit.hexsha}"
+                    ).split()
+                    local_ahead, remote_ahead = int(counts[0]), int(counts[1])
 
-                    changes_summary = (
-                        f"Remote is {len(ahead_commits)} commits ahead, local is {len(behind_commits)} commits ahead"
-                    )
+                    changes_summary = f"Remote is {remote_ahead} commits ahead, local is {local_ahead} commits ahead"
 
-                    if ahead_commits:
-                        changes_summary += f". Latest remote commit: {ahead_commits[0].message.split(chr(10))[0]}"
+                    if remote_ahead:
+                        # The remote tip is the newest commit the local side is missing
+                        changes_summary += f". Latest remote commit: {remote_commit.message.split(chr(10))[0]}"
 
                 except Exception:
                     changes_summary = f"Commit hashes differ: local={local_info['commit_hash'][:8]}, remote={remote_info['commit_hash'][:8]}"
@@ -48,6 +48,10 @@ class ProviderRegistry:
         """Get all registered providers."""
         return self._providers.copy()
 
+    def provider_names(self) -> list[str]:
+        """Get the names of all registered providers, in registration order."""
+        return [provider.get_name() for provider in self._providers]
+
     def get_provider_by_name(self, name: str) -> Optional[GitProvider]:
         """Get a provider by name."""
         for provider in self._providers:
@@ -13,14 +13,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from git import Repo
-
 from metagit.core.config.manager import MetagitConfigManager
 from metagit.core.config.models import MetagitConfig
 from metagit.core.record.models import MetagitRecord
 from metagit.core.utils.logging import LoggerConfig, UnifiedLogger
 from metagit.core.utils.yaml_class import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
@@ -31,6 +34,23 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _read_json(path: Path) -> Any:
+    """Read a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a JSON document with a two-space indent, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, cls=DateTimeEncoder)
+
+
 class RecordStorageBackend(ABC):
     """Abstract base class for record storage backends."""
 
@@ -89,18 +109,15 @@ class LocalFileStorageBackend(RecordStorageBackend):
     def _ensure_index_exists(self) -> None:
         """Ensure the index file exists."""
         if not self.index_file.exists():
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump({"records": {}, "next_id": 1}, f)
+            _write_json(self.index_file, {"records": {}, "next_id": 1})
 
     def _load_index(self) -> Dict[str, Any]:
         """Load the index file."""
-        with open(self.index_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json(self.index_file)
 
     def _save_index(self, index_data: Dict[str, Any]) -> None:
         """Save the index file."""
-        with open(self.index_file, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, indent=2)
+        _write_json(self.index_file, index_data)
 
     def _get_next_id(self) -> str:
         """Get the next available record ID."""
@@ -116,14 +133,13 @@ class LocalFileStorageBackend(RecordStorageBackend):
             record_id = self._get_next_id()
             record_file = self.storage_dir / f"{record_id}.json"
 
-            # Add metadata
-            record_data = record.model_dump(exclude_none=True, exclude_defaults=True)
+            # Add metadata; mode="json" leaves only JSON-native values to encode
+            record_data = record.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
             record_data["record_id"] = record_id
             record_data["created_at"] = datetime.now().isoformat()
             record_data["updated_at"] = datetime.now().isoformat()
 
-            with open(record_file, "w", encoding="utf-8") as f:
-                json.dump(record_data, f, indent=2, cls=DateTimeEncoder)
+            _write_json(record_file, record_data)
 
             # Update index
             index_data = self._load_index()
@@ -146,8 +162,7 @@ class LocalFileStorageBackend(RecordStorageBackend):
             if not record_file.exists():
                 return FileNotFoundError(f"Record not found: {record_id}")
 
-            with open(record_file, "r", encoding="utf-8") as f:
-                record_data = json.load(f)
+            record_data = _read_json(record_file)
 
             # Remove metadata fields before creating record
             record_data.pop("record_id", None)
@@ -166,17 +181,15 @@ class LocalFileStorageBackend(RecordStorageBackend):
                 return FileNotFoundError(f"Record not found: {record_id}")
 
             # Load existing data to preserve metadata
-            with open(record_file, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
+            existing_data = _read_json(record_file)
 
             # Update record data
-            record_data = record.model_dump(exclude_none=True, exclude_defaults=True)
+            record_data = record.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
             record_data["record_id"] = record_id
             record_data["created_at"] = existing_data.get("created_at")
             record_data["updated_at"] = datetime.now().isoformat()
 
-            with open(record_file, "w", encoding="utf-8") as f:
-                json.dump(record_data, f, indent=2, cls=DateTimeEncoder)
+            _write_json(record_file, record_data)
 
             # Update index
             index_data = self._load_index()
@@ -417,6 +430,8 @@ class MetagitRecordManager:
 
     def _get_git_info(self) -> Dict[str, Optional[str]]:
         """Get current git repository information."""
+        from git import Repo
+
         try:
             repo = Repo(Path.cwd())
             return {
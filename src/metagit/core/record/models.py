@@ -3,12 +3,18 @@
 Pydantic models for metagit records.
 """
 
+import functools
 from datetime import datetime
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, FrozenSet, List, Optional, Type, TypeVar
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as YamlDumper
+
 from metagit.core.config.models import (
     AlertingChannel,
     Artifact,
@@ -55,6 +61,24 @@ from metagit.core.utils.files import DirectoryDetails, DirectorySummary
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def _model_field_names(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Field names of a Pydantic model class, computed once per class."""
+    return frozenset(model.model_fields)
+
+
+@functools.lru_cache(maxsize=None)
+def _common_field_names(source_model: Type[BaseModel], target_model: Type[BaseModel]) -> FrozenSet[str]:
+    """Field names shared by two Pydantic model classes, computed once per pair."""
+    return _model_field_names(source_model) & _model_field_names(target_model)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Default value of every field of a Pydantic model class, for comparisons only."""
+    return {name: field.get_default(call_default_factory=True) for name, field in model.model_fields.items()}
+
+
 def _get_common_fields(source_model: Type[BaseModel], target_model: Type[BaseModel]) -> set[str]:
     """
     Automatically detect common fields between two Pydantic models.
@@ -69,9 +93,7 @@ def _get_common_fields(source_model: Type[BaseModel], target_model: Type[BaseMod
     Returns:
         Set of field names that exist in both models
     """
-    source_fields = set(source_model.model_fields.keys())
-    target_fields = set(target_model.model_fields.keys())
-    return source_fields & target_fields
+    return set(_common_field_names(source_model, target_model))
 
 
 def _convert_model_data(
@@ -106,7 +128,7 @@ def _convert_model_data(
             source_data = mapped_data
 
         # Filter to only include fields that exist in target model
-        target_fields = set(target_model.model_fields.keys())
+        target_fields = _model_field_names(target_model)
         filtered_data = {k: v for k, v in source_data.items() if k in target_fields}
 
         # Use model_validate for fast, validated conversion
@@ -207,7 +229,10 @@ class MetagitRecord(MetagitConfig):
 
     def to_yaml(self) -> str:
         """Convert a MetagitRecord to a YAML string."""
-        return yaml.safe_dump(self.model_dump(exclude_none=True, exclude_defaults=True))
+        return yaml.dump(
+            self.model_dump(exclude_none=True, exclude_defaults=True),
+            Dumper=YamlDumper,
+        )
 
     @classmethod
     def to_json(self) -> str:
@@ -220,7 +245,7 @@ class MetagitRecord(MetagitConfig):
 
         This method efficiently converts a MetagitRecord to a MetagitConfig by:
         1. Using Pydantic's field introspection to automatically detect compatible fields
-        2. Leveraging model_dump() with field filtering for optimal performance
+        2. Reading the shared, non-default field values directly instead of a full model_dump()
         3. Using model_validate() for fast, validated conversion
         4. Automatically handling field differences between models
 
@@ -242,11 +267,16 @@ class MetagitRecord(MetagitConfig):
             - No deep copying of nested objects (uses references)
         """
         _ = exclude_detection_fields
-        # Get the model data, excluding None values and defaults for performance
-        model_data = self.model_dump(
-            exclude_none=True,
-            exclude_defaults=True,
-        )
+        # Take the shared fields that are neither None nor defaulted straight from the instance
+        # (what model_dump(exclude_none=True, exclude_defaults=True) keeps) instead of dumping
+        # every field to plain data; nested models are passed through as-is
+        values = self.__dict__
+        defaults = _field_defaults(type(self))
+        model_data = {
+            name: values[name]
+            for name in _common_field_names(type(self), MetagitConfig)
+            if values[name] is not None and values[name] != defaults[name]
+        }
 
         # Use the generic conversion utility for automatic field mapping
         return _convert_model_data(model_data, MetagitConfig)
@@ -427,8 +457,8 @@ class MetagitRecord(MetagitConfig):
         Returns:
             dict: Field differences between the models
         """
-        record_fields = set(cls.model_fields.keys())
-        config_fields = set(MetagitConfig.model_fields.keys())
+        record_fields = _model_field_names(cls)
+        config_fields = _model_field_names(MetagitConfig)
 
         return {
             "common_fields": sorted(record_fields & config_fields),
@@ -4,12 +4,13 @@ File reader tool for the detect flow
 """
 
 import fnmatch
+import functools
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Union
 
-from git import Repo
 from pydantic import BaseModel
 
 from metagit import DATA_PATH
@@ -132,25 +133,46 @@ def list_files(directory_path: str) -> List[str]:
         return []
 
 
-def list_git_files(directory_path: str) -> List[Path]:
+def iter_git_files(directory_path: str) -> Union[Iterator[Path], Exception]:
     """
-    List all files in a Git repository.
+    Iterate over all files in a Git repository.
+
+    The file listing is read from git up front; Path objects are only built as
+    the iterator is consumed.
 
     Args:
         directory_path: Path to the Git repository
     Returns:
-        List of file paths in the repository
+        Iterator of file paths in the repository
     """
+    from git import Repo
+
     try:
         repo = Repo(directory_path)
     except Exception as e:
         return Exception(f"Not a valid Git repository: {e}")
     try:
-        values = repo.git.ls_files("--cached", "--others", "--exclude-standard").splitlines()
+        # NUL-separated raw bytes: paths are not C-quoted and need no upfront text decode
+        output = repo.git.ls_files("--cached", "--others", "--exclude-standard", "-z", stdout_as_string=False)
     except Exception as e:
         return Exception(f"Error listing files in Git repository: {e}")
 
-    return [Path(v) for v in values]
+    return (Path(os.fsdecode(m.group())) for m in re.finditer(rb"[^\0]+", output))
+
+
+def list_git_files(directory_path: str) -> List[Path]:
+    """
+    List all files in a Git repository.
+
+    Args:
+        directory_path: Path to the Git repository
+    Returns:
+        List of file paths in the repository
+    """
+    files = iter_git_files(directory_path)
+    if isinstance(files, Exception):
+        return files
+    return list(files)
 
 
 def read_file_lines(file_path: str) -> List[str]:
@@ -320,11 +342,31 @@ class FileExtensionLookup:
         Returns:
             FileTypeInfo tuple containing name and type, or None if not found
         """
-        # Extract extension and normalize
         _, ext = os.path.splitext(filename)
-        ext = ext.lower()
+        return self.get_extension_info(ext)
+
+    def get_extension_info(self, extension: str) -> Optional[FileTypeInfo]:
+        """
+        Look up file type information for an extension as returned by ``os.path.splitext``.
+
+        Args:
+            extension: Extension including the leading dot, e.g. ``.py``
 
-        return self._lookup.get(ext)
+        Returns:
+            FileTypeInfo tuple containing name and type, or None if not found
+        """
+        return self._lookup.get(extension.lower())
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_lookup() -> FileExtensionLookup:
+    """
+    Return the shared FileExtensionLookup for the bundled file-types data.
+
+    The extension table is parsed on first use and reused for every later call,
+    so repeated directory_details() walks do not re-read the JSON file.
+    """
+    return FileExtensionLookup()
 
 
 def parse_gitignore(ignore_file: Path) -> Set[str]:
@@ -340,18 +382,18 @@ def parse_gitignore(ignore_file: Path) -> Set[str]:
     """
     ignore_patterns = set()
 
-    if Path(ignore_file).exists():
-        try:
-            with open(ignore_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith("#"):
-                        # Remove trailing slash from patterns
-                        line = line.rstrip("/")
-                        ignore_patterns.add(line)
-        except Exception:
-            pass
+    # Most directories have no .gitignore; opening directly avoids a stat per directory
+    try:
+        with open(ignore_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                # Skip empty lines and comments
+                if line and not line.startswith("#"):
+                    # Remove trailing slash from patterns
+                    line = line.rstrip("/")
+                    ignore_patterns.add(line)
+    except Exception:
+        pass
 
     return ignore_patterns
 
@@ -378,19 +420,33 @@ def should_ignore_path(path: Path, ignore_patterns: Set[str], base_path: Path) -
         # Path is not relative to base, use the path name
         relative_path = Path(path.name)
 
-    relative_str = str(relative_path)
-
-    # Check each pattern
-    for pattern in ignore_patterns:
-        # Handle file patterns
-        if (
-            fnmatch.fnmatch(relative_str, pattern)
-            or fnmatch.fnmatch(path.name, pattern)
-            or fnmatch.fnmatch(relative_str, pattern)
-        ):
-            return True
-
-    return False
+    # One regex match covering every pattern, instead of an fnmatch call per pattern
+    matches = _compile_ignore_patterns(frozenset(ignore_patterns))
+    return bool(matches(os.path.normcase(str(relative_path))) or matches(os.path.normcase(path.name)))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_ignore_patterns(ignore_patterns: FrozenSet[str]) -> Callable[[str], Optional[re.Match]]:
+    """Compile glob patterns into the match function of a single alternation regex."""
+    regex = "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in sorted(ignore_patterns))
+    return re.compile(regex).match
+
+
+# Dependency, virtualenv, cache and build output directories skipped by the directory walkers
+DEFAULT_PRUNE_DIRS: FrozenSet[str] = frozenset(
+    {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "target",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
 
 
 def directory_details(
@@ -398,6 +454,7 @@ def directory_details(
     file_lookup: FileExtensionLookup,
     ignore_patterns: Optional[Set[str]] = None,
     resolve_path: bool = False,
+    prune_dirs: FrozenSet[str] = DEFAULT_PRUNE_DIRS,
 ) -> DirectoryDetails:
     """
     Recursively walks a directory and builds detailed metadata structure using FileExtensionLookup.
@@ -406,6 +463,7 @@ def directory_details(
         target_path: Path to the target directory to analyze
         file_lookup: Single instance of FileExtensionLookup for file type information
         ignore_patterns: Set of patterns to ignore (applied to all subdirectories)
+        prune_dirs: Directory names that are never descended into
 
     Returns:
         DirectoryDetails: NamedTuple containing directory structure and detailed file statistics grouped by category
@@ -427,29 +485,42 @@ def directory_details(
     }
     subpaths: List[DirectoryDetails] = []
     num_files = 0
+    # Files are tallied per raw extension and classified once per distinct extension below
+    extension_counts: Dict[str, int] = {}
+
+    ignore_match = _compile_ignore_patterns(frozenset(ignore_patterns)) if ignore_patterns else None
 
     # Process directory contents
-    for item in path.iterdir():
-        # Always ignore .git folders
-        if item.name == ".git":
-            continue
-        # Check if item should be ignored based on ignore_patterns
-        if should_ignore_path(item, ignore_patterns, Path(target_path)):
-            continue
-        if item.is_dir():
-            # Recursively process subdirectory with the same ignore_patterns
-            sub_metadata = directory_details(str(item), file_lookup, ignore_patterns, resolve_path)
-            subpaths.append(sub_metadata)
-        else:
-            # Count file and get detailed type information
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Always ignore .git folders
+            if entry.name == ".git":
+                continue
+            # Skip well-known heavy directories before any pattern matching
+            if entry.name in prune_dirs and entry.is_dir():
+                continue
+            # Check if item should be ignored based on ignore_patterns; entries are direct
+            # children, so their path relative to this directory is just their name
+            if ignore_match and ignore_match(os.path.normcase(entry.name)):
+                continue
+            if entry.is_dir():
+                # Recursively process subdirectory with the same ignore_patterns
+                sub_metadata = directory_details(entry.path, file_lookup, ignore_patterns, resolve_path, prune_dirs)
+                subpaths.append(sub_metadata)
+                continue
+            # Count file by extension
             num_files += 1
-            file_info = file_lookup.get_file_info(item.name)
-            if file_info:
-                # Group by type category and count by kind
-                category = file_info.type
-                kind = file_info.kind
-                if category in file_type_counts:
-                    file_type_counts[category][kind] = file_type_counts[category].get(kind, 0) + 1
+            ext = os.path.splitext(entry.name)[1]
+            extension_counts[ext] = extension_counts.get(ext, 0) + 1
+
+    for ext, count in extension_counts.items():
+        file_info = file_lookup.get_extension_info(ext)
+        if file_info:
+            # Group by type category and count by kind
+            category = file_info.type
+            kind = file_info.kind
+            if category in file_type_counts:
+                file_type_counts[category][kind] = file_type_counts[category].get(kind, 0) + count
 
     # Convert counts to percentages based on total files in directory
     file_types_by_category: Dict[str, List[FileTypeWithPercent]] = {}
@@ -470,6 +541,18 @@ def directory_details(
     )
 
 
+def _file_type_key(name: str) -> str:
+    """
+    Return the extension without the dot, or the full name if there is no extension.
+
+    Mirrors ``Path(name).suffix`` without constructing a Path per directory entry.
+    """
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i + 1 :]
+    return name
+
+
 class FileType(BaseModel):
     type: str
     count: int
@@ -486,6 +569,7 @@ def directory_summary(
     target_path: str,
     ignore_patterns: Optional[Set[str]] = None,
     resolve_path: bool = False,
+    prune_dirs: FrozenSet[str] = DEFAULT_PRUNE_DIRS,
 ) -> DirectorySummary:
     """
     Recursively walks a directory and builds a metadata structure for a directory summary.
@@ -495,6 +579,7 @@ def directory_summary(
     Args:
         target_path: Path to the target directory to analyze
         ignore_patterns: Set of patterns to ignore (applied to all subdirectories)
+        prune_dirs: Directory names that are never descended into
 
     Returns:
         DirectorySummary: Pydantic model containing directory structure and file statistics
@@ -513,25 +598,29 @@ def directory_summary(
     subpaths: List[DirectorySummary] = []
     num_files = 0
 
+    ignore_match = _compile_ignore_patterns(frozenset(ignore_patterns)) if ignore_patterns else None
+
     # Process directory contents
-    for item in path.iterdir():
-        # Always ignore .git folders
-        if item.name == ".git":
-            continue
-        # Check if item should be ignored based on ignore_patterns
-        if should_ignore_path(item, ignore_patterns, Path(target_path)):
-            continue
-        if item.is_dir():
-            # Recursively process subdirectory with the same ignore_patterns
-            sub_metadata = directory_summary(str(item), ignore_patterns, resolve_path)
-            subpaths.append(sub_metadata)
-        else:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Always ignore .git folders
+            if entry.name == ".git":
+                continue
+            # Skip well-known heavy directories before any pattern matching
+            if entry.name in prune_dirs and entry.is_dir():
+                continue
+            # Check if item should be ignored based on ignore_patterns; entries are direct
+            # children, so their path relative to this directory is just their name
+            if ignore_match and ignore_match(os.path.normcase(entry.name)):
+                continue
+            if entry.is_dir():
+                # Recursively process subdirectory with the same ignore_patterns
+                sub_metadata = directory_summary(entry.path, ignore_patterns, resolve_path, prune_dirs)
+                subpaths.append(sub_metadata)
+                continue
             # Count file and type
             num_files += 1
-
-            file_ext = (
-                item.suffix[1:] if item.suffix else item.name
-            )  # Only the extension without the dot, or full name if no extension
+            file_ext = _file_type_key(entry.name)
             file_types[file_ext] = file_types.get(file_ext, 0) + 1
 
     # Convert file types to list of FileType models
@@ -1,16 +1,15 @@
 #! /usr/bin/env python3
 
-import asyncio
-import threading
-from contextlib import suppress
-from typing import Any, Callable, Dict, List, Optional, Union
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from rapidfuzz import fuzz, process
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import Horizontal, Vertical
-from textual.widgets import Input, Label, ListItem, ListView, Static
+from rapidfuzz.distance import JaroWinkler
+
+if TYPE_CHECKING:
+    from textual.color import Color
 
 """
 This is a fuzzy finder that uses Textual and rapidfuzz to find items in a list.
@@ -21,12 +20,72 @@ I'm only doing this because I don't want to have to wrap the fzf binary in a pyt
 class FuzzyFinderTarget(BaseModel):
     """A target for a fuzzy finder."""
 
+    # Immutable value type: targets can be hashed, compared and shared between finders
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     color: Optional[str] = None
     opacity: Optional[float] = None
 
 
+def _parse_color_spec(color_spec: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a color specification into its text color and background color."""
+    # Handle different color formats
+    if color_spec.startswith("bg:"):
+        # Background color
+        return None, color_spec[3:]  # Remove 'bg:' prefix
+    if not color_spec.startswith("#") and " bg:" in color_spec:
+        # Color with background (e.g., "white bg:#ff0000")
+        parts = color_spec.split(" bg:")
+        if len(parts) != 2:
+            return None, None
+        text_color, bg_color = parts
+        return text_color.strip(), bg_color.strip()
+    # Hex colors, basic color names or anything else (could be a rich color spec) apply as-is
+    return color_spec, None
+
+
+# Scorers that return similarities in [0, 1]; their scores are scaled to 0-100
+_UNIT_SCORERS = frozenset({"jaro_winkler"})
+
+
+def _to_color(value: Optional[str]) -> Optional["Color"]:
+    """Parse a color name or value, ignoring Rich style words such as ``bold``."""
+    if not value:
+        return None
+    from textual.color import Color, ColorParseError
+
+    try:
+        return Color.parse(value)
+    except ColorParseError:
+        words = value.split()
+        if len(words) > 1:
+            return _to_color(words[-1])
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_color_spec(color_spec: str) -> Optional[Tuple[Optional["Color"], Optional["Color"]]]:
+    """Resolve a color specification to Textual colors, once per distinct specification."""
+    text_color, bg_color = _parse_color_spec(color_spec)
+    compiled = (_to_color(text_color), _to_color(bg_color))
+    return None if compiled == (None, None) else compiled
+
+
+class _Choices(NamedTuple):
+    """Per-item values in search order, stored as parallel lists indexed like ``items``."""
+
+    items: List[Any]
+    display: List[str]
+    # Strings compared against the query: display values, case-folded unless case_sensitive
+    folded: List[str]
+    preview: List[Optional[str]]
+    # (text color, background) compiled from each item's color spec, None when uncolored
+    styles: List[Optional[Tuple[Optional["Color"], Optional["Color"]]]]
+    opacities: List[Optional[float]]
+
+
 class FuzzyFinderConfig(BaseModel):
     """Configuration for a fuzzy finder using Textual and rapidfuzz."""
 
@@ -41,7 +100,10 @@ class FuzzyFinderConfig(BaseModel):
     max_results: int = Field(10, ge=1, description="Maximum number of results to display.")
     scorer: str = Field(
         "partial_ratio",
-        description="Fuzzy matching scorer: 'partial_ratio', 'ratio', or 'token_sort_ratio'.",
+        description=(
+            "Fuzzy matching scorer: 'partial_ratio', 'ratio', 'token_sort_ratio', 'WRatio', or 'jaro_winkler'. "
+            "'WRatio' and 'jaro_winkler' suit short values such as file names."
+        ),
     )
     prompt_text: str = Field("> ", description="Prompt text displayed in the input field.")
     case_sensitive: bool = Field(False, description="Whether matching is case-sensitive.")
@@ -72,6 +134,15 @@ class FuzzyFinderConfig(BaseModel):
         description="Total candidates available before filtering/capping (for UI status text).",
     )
     query_mode_label: str = Field("filtered", description="Label used in UI status text for matched results.")
+    debounce_seconds: float = Field(
+        0.04,
+        ge=0.0,
+        description="Delay after the last keystroke before rescoring; 0 rescores on every keystroke.",
+    )
+
+    # Choices built from ``items``, rebuilt only when the list is reassigned
+    _choices_source: Optional[List[Any]] = PrivateAttr(default=None)
+    _choices: Optional[_Choices] = PrivateAttr(default=None)
 
     @field_validator("items")
     @classmethod
@@ -91,7 +162,7 @@ class FuzzyFinderConfig(BaseModel):
     @classmethod
     def validate_scorer(cls, v: str) -> str:
         """Ensure scorer is valid."""
-        valid_scorers = ["partial_ratio", "ratio", "token_sort_ratio"]
+        valid_scorers = ["partial_ratio", "ratio", "token_sort_ratio", "WRatio", "jaro_winkler"]
         if v not in valid_scorers:
             raise ValueError(f"Scorer must be one of {valid_scorers}.")
         return v
@@ -118,6 +189,8 @@ class FuzzyFinderConfig(BaseModel):
                 "partial_ratio": fuzz.partial_ratio,
                 "ratio": fuzz.ratio,
                 "token_sort_ratio": fuzz.token_sort_ratio,
+                "WRatio": fuzz.WRatio,
+                "jaro_winkler": JaroWinkler.normalized_similarity,
             }
             return scorer_map[self.scorer]
         except Exception as e:
@@ -179,453 +252,74 @@ class FuzzyFinderConfig(BaseModel):
                 return item.opacity
 
             # Fall back to config's item_opacity
-            return self.config.item_opacity
+            return self.item_opacity
         except Exception:
-            return self.config.item_opacity
-
-
-class FuzzyFinderApp(App):
-    """A Textual app for fuzzy finding."""
-
-    CSS = """
-    .fuzzy-finder-input {
-        dock: top;
-        height: 3;
-        border: solid $primary;
-    }
-    
-    .fuzzy-finder-split {
-        height: 1fr;
-    }
-
-    .fuzzy-finder-results {
-        width: 35%;
-        border: solid $primary;
-        scrollbar-gutter: stable;
-        overflow-y: auto;
-        height: 1fr;
-    }
-    
-    .fuzzy-finder-preview {
-        width: 65%;
-        border: solid $primary;
-        overflow-y: auto;
-        height: 1fr;
-    }
-    
-    .highlighted {
-        background: $primary;
-        color: $text;
-    }
-    
-    .list-item-normal {
-        opacity: 1.0;
-    }
-    
-    .list-item-opacity {
-        /* Opacity will be set dynamically */
-    }
-    
-    .list-item-custom-color {
-        /* Custom color will be set dynamically via styles */
-    }
-    """
-
-    BINDINGS = [
-        Binding("ctrl+c", "quit", "Quit"),
-        Binding("escape", "quit", "Quit"),
-        Binding("enter", "select", "Select", priority=True),
-        Binding("up", "cursor_up", "Up", show=False, priority=True),
-        Binding("down", "cursor_down", "Down", show=False, priority=True),
-        Binding("pageup", "page_up", "Page Up", show=False, priority=True),
-        Binding("pagedown", "page_down", "Page Down", show=False, priority=True),
-        Binding("home", "cursor_home", "Home", show=False, priority=True),
-        Binding("end", "cursor_end", "End", show=False, priority=True),
-    ]
-
-    def __init__(self, config: FuzzyFinderConfig, **kwargs):
-        super().__init__(**kwargs)
-        self.config = config
-        self.current_results: List[Any] = []
-        self.selected_item: Optional[Any] = None
-        self.highlighted_index = 0
-
-    def compose(self) -> ComposeResult:
-        """Create child widgets for the app."""
-        with Vertical():
-            # Input field
-            yield Input(
-                placeholder=self.config.prompt_text,
-                id="search_input",
-                classes="fuzzy-finder-input",
-            )
-
-            if self.config.enable_preview:
-                with Horizontal(classes="fuzzy-finder-split"):
-                    yield ListView(id="results_list", classes="fuzzy-finder-results")
-                    yield Static("", id="preview_pane", classes="fuzzy-finder-preview")
-            else:
-                # Just results
-                yield ListView(id="results_list", classes="fuzzy-finder-results")
-            yield Static("", id="results_meta")
-
-    def on_mount(self) -> None:
-        """Called when app starts."""
-        # Initial search with empty query
-        self._perform_search("")
-        # Focus the input
-        self.query_one("#search_input", Input).focus()
-
-    def on_input_changed(self, event: Input.Changed) -> None:
-        """Called when the input changes."""
-        if event.input.id == "search_input":
-            self._perform_search(event.value)
-
-    def _perform_search(self, query: str) -> None:
-        """Perform fuzzy search and update results."""
-        try:
-            results = self._search(query)
-            if isinstance(results, Exception):
-                # Handle error - for now just show empty results
-                results = []
-
-            self.current_results = results
-            self.highlighted_index = 0
-            self._update_results_list()
-            self._update_results_meta(query)
-
-            if self.config.enable_preview:
-                self._update_preview()
+            return self.item_opacity
 
-        except Exception:
-            # Handle error gracefully
-            self.current_results = []
-            self._update_results_list()
-            self._update_results_meta(query)
+    def get_choices(self) -> Union[_Choices, Exception]:
+        """
+        Extract display, preview and style values for every item once.
 
-    def _update_results_meta(self, query: str) -> None:
-        """Show concise result counters for current query."""
+        Items are ordered by display value when ``sort_items`` is set. The lists are
+        reused for every keystroke so searching and rendering never go back to
+        attribute lookups on the item objects.
+        """
         try:
-            meta = self.query_one("#results_meta", Static)
-            shown_count = len(self.current_results)
-            total_count = self.config.total_count if self.config.total_count is not None else len(self.config.items)
-            cap_count = self.config.max_results
-            mode_label = self.config.query_mode_label
-            query_label = query if query else "all"
-            meta.update(f"Showing {shown_count}/{total_count} ({mode_label}, limit={cap_count}) | query: {query_label}")
-        except Exception:
-            return
-
-    def _update_results_list(self) -> None:
-        """Update the results ListView."""
-        results_list = self.query_one("#results_list", ListView)
-        results_list.clear()
-
-        for i, result in enumerate(self.current_results):
-            display_value = self.config.get_display_value(result)
-            if isinstance(display_value, Exception):
-                display_value = str(result)
-
-            # Create list item
-            item = ListItem(Label(display_value))
-
-            # Apply highlighting
-            if i == self.highlighted_index:
-                item.add_class("highlighted")
-
-            # Apply custom color if configured
-            custom_color = self.config.get_item_color(result)
-            if custom_color:
-                item.add_class("list-item-custom-color")
-                # Parse and apply the custom color
-                self._apply_custom_color(item, custom_color)
-
-            # Apply opacity - prioritize FuzzyFinderTarget.opacity over config.item_opacity
-            item_opacity = self.config.get_item_opacity(result)
-            if item_opacity is not None:
-                item.add_class("list-item-opacity")
-                # Set opacity via inline style
-                item.styles.opacity = item_opacity
-            else:
-                item.add_class("list-item-normal")
-
-            results_list.append(item)
-
-        # Set the ListView's index to match our highlighted_index
-        if self.current_results and 0 <= self.highlighted_index < len(self.current_results):
-            results_list.index = self.highlighted_index
+            if self._choices is not None and self._choices_source is self.items:
+                return self._choices
 
-    def _apply_custom_color(self, item: ListItem, color_spec: str) -> None:
-        """Apply custom color to a list item based on color specification."""
-        try:
-            # Handle different color formats
-            if color_spec.startswith("#"):
-                # Hex color
-                item.styles.color = color_spec
-            elif color_spec.startswith("bg:"):
-                # Background color
-                bg_color = color_spec[3:]  # Remove 'bg:' prefix
-                item.styles.background = bg_color
-            elif " bg:" in color_spec:
-                # Color with background (e.g., "white bg:#ff0000")
-                parts = color_spec.split(" bg:")
-                if len(parts) == 2:
-                    text_color, bg_color = parts
-                    item.styles.color = text_color.strip()
-                    item.styles.background = bg_color.strip()
-            elif color_spec in [
-                "red",
-                "green",
-                "blue",
-                "yellow",
-                "cyan",
-                "magenta",
-                "white",
-                "black",
-            ]:
-                # Basic color names
-                item.styles.color = color_spec
+            if self.display_field:
+                # One attrgetter for all items instead of getattr by name per item
+                get_field = operator.attrgetter(self.display_field)
+                display = [item if isinstance(item, str) else str(get_field(item)) for item in self.items]
             else:
-                # Try to apply as-is (could be a rich color spec)
-                item.styles.color = color_spec
-        except Exception:
-            # If color application fails, silently continue
-            pass
-
-    def _update_preview(self) -> None:
-        """Update the preview pane."""
-        if not self.config.enable_preview:
-            return
-
-        preview_pane = self.query_one("#preview_pane", Static)
-
-        if not self.current_results or self.highlighted_index >= len(self.current_results):
-            preview_pane.update("No preview available")
-            return
-
-        highlighted_item = self.current_results[self.highlighted_index]
-        preview_value = self.config.get_preview_value(highlighted_item)
-
-        if isinstance(preview_value, Exception) or preview_value is None:
-            preview_value = str(highlighted_item)
-
-        if self.config.preview_header:
-            preview_text = f"{self.config.preview_header}\n\n{preview_value}"
-        else:
-            preview_text = preview_value
-
-        preview_pane.update(preview_text)
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Called when a list item is selected."""
-        if event.list_view.id == "results_list" and self.current_results:
-            # Update highlighted index based on selection
-            results_list = self.query_one("#results_list", ListView)
-            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
-                self.highlighted_index = results_list.index
-                self.selected_item = self.current_results[self.highlighted_index]
-                self.exit(self.selected_item)
-
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
-        """Called when a list item is highlighted (but not selected)."""
-        if event.list_view.id == "results_list" and self.current_results:
-            # Keep our highlighted_index in sync with ListView
-            results_list = self.query_one("#results_list", ListView)
-            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
-                self.highlighted_index = results_list.index
-                if self.config.enable_preview:
-                    self._update_preview()
-
-    def action_cursor_up(self) -> None:
-        """Move cursor up."""
-        if self.current_results and self.highlighted_index > 0:
-            self.highlighted_index -= 1
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def action_cursor_down(self) -> None:
-        """Move cursor down."""
-        if self.current_results and self.highlighted_index < len(self.current_results) - 1:
-            self.highlighted_index += 1
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def _scroll_to_highlighted(self) -> None:
-        """Scroll the results list to ensure the highlighted item is visible."""
-        try:
-            results_list = self.query_one("#results_list", ListView)
-            if self.highlighted_index < len(results_list.children):
-                # Get the highlighted list item
-                highlighted_item = results_list.children[self.highlighted_index]
-                # Scroll to make the item visible
-                results_list.scroll_to_widget(highlighted_item)
-        except Exception:
-            # If scrolling fails, continue without it
-            pass
-
-    def action_page_up(self) -> None:
-        """Move cursor up by a page (10 items)."""
-        if self.current_results:
-            page_size = 10
-            self.highlighted_index = max(0, self.highlighted_index - page_size)
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def action_page_down(self) -> None:
-        """Move cursor down by a page (10 items)."""
-        if self.current_results:
-            page_size = 10
-            max_index = len(self.current_results) - 1
-            self.highlighted_index = min(max_index, self.highlighted_index + page_size)
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def action_cursor_home(self) -> None:
-        """Move cursor to the first item."""
-        if self.current_results:
-            self.highlighted_index = 0
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def action_cursor_end(self) -> None:
-        """Move cursor to the last item."""
-        if self.current_results:
-            self.highlighted_index = len(self.current_results) - 1
-            self._update_results_list()
-            self._scroll_to_highlighted()
-            if self.config.enable_preview:
-                self._update_preview()
-
-    def action_select(self) -> None:
-        """Select the highlighted item."""
-        # First try to get the current selection from the ListView
-        try:
-            results_list = self.query_one("#results_list", ListView)
-            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
-                self.highlighted_index = results_list.index
-        except Exception:
-            pass
-
-        # Select the highlighted item
-        if self.current_results and self.highlighted_index < len(self.current_results):
-            self.selected_item = self.current_results[self.highlighted_index]
-            self.exit(self.selected_item)
-        else:
-            self.exit(None)
-
-    def action_quit(self) -> None:
-        """Quit the application."""
-        self.exit(None)
-
-    def _search(self, query: str) -> Union[List[Any], Exception]:
-        """Perform fuzzy search based on the query."""
-        try:
-            items_to_search = self.config.items
-            if self.config.sort_items:
-                # Sort items based on their display value when possible.
-                with suppress(Exception):
-                    items_to_search = sorted(
-                        items_to_search,
-                        key=lambda item: str(self.config.get_display_value(item) or ""),
-                    )
-
-            choices_with_originals = [(self.config.get_display_value(item), item) for item in items_to_search]
-            # Check for exceptions
-            choice_exceptions = [c[0] for c in choices_with_originals if isinstance(c[0], Exception)]
-            if choice_exceptions:
-                return choice_exceptions[0]
-
-            choices = [str(c[0]) for c in choices_with_originals]
-
-            if not query:
-                return [item[1] for item in choices_with_originals]
-
-            # Prepare query for case-insensitive matching
-            query_lower = query.lower() if not self.config.case_sensitive else query
-
-            scorer_func = self.config.get_scorer_function()
-            if isinstance(scorer_func, Exception):
-                return scorer_func
-
-            # Get fuzzy search results
-            results = process.extract(
-                query,
-                choices,
-                scorer=scorer_func,
-                limit=len(choices),  # Get all results for custom sorting
+                display_values = [self.get_display_value(item) for item in self.items]
+                for value in display_values:
+                    if isinstance(value, Exception):
+                        return value
+                display = [str(value) for value in display_values]
+
+            order = range(len(self.items))
+            if self.sort_items:
+                order = sorted(order, key=display.__getitem__)
+            items = [self.items[i] for i in order]
+
+            display = [display[i] for i in order]
+            preview: List[Optional[str]] = [None] * len(items)
+            if self.enable_preview and self.preview_field:
+                get_preview = operator.attrgetter(self.preview_field)
+                preview = [item if isinstance(item, str) else self._preview_text(get_preview, item) for item in items]
+            colors = self._resolve_colors(items, display)
+            self._choices = _Choices(
+                items=items,
+                display=display,
+                folded=display if self.case_sensitive else [value.casefold() for value in display],
+                preview=preview,
+                styles=[_compile_color_spec(color) if color else None for color in colors],
+                opacities=[self.get_item_opacity(item) for item in items],
             )
-
-            # Custom scoring and sorting to prioritize exact matches
-            scored_results = []
-            for result_str, score, index in results:
-                if score < self.config.score_threshold:
-                    continue
-
-                choice_lower = result_str.lower() if not self.config.case_sensitive else result_str
-
-                # Calculate custom score based on match type
-                custom_score = score
-
-                # Bonus for exact matches
-                if choice_lower == query_lower:
-                    custom_score += 1000
-                # Bonus for prefix matches
-                elif choice_lower.startswith(query_lower):
-                    custom_score += 500
-                # Bonus for longer matches (more specific)
-                elif len(choice_lower) > len(query_lower):
-                    length_bonus = min(100, (len(choice_lower) - len(query_lower)) * 10)
-                    custom_score += length_bonus
-
-                scored_results.append((custom_score, result_str, choices_with_originals[index][1]))
-
-            # Sort by custom score (highest first) and then by original string length (shorter first for same score)
-            scored_results.sort(key=lambda x: (-x[0], len(x[1])))
-
-            # Return all matched results to allow full manual scrolling.
-            return [item[2] for item in scored_results]
-
+            self._choices_source = self.items
+            return self._choices
         except Exception as e:
             return e
 
-
-def _run_textual_app(app: App) -> Any:
-    """
-    Run a Textual app even when the caller already has a running asyncio loop.
-
-    Nested Textual apps (for example the repo picker launched from ``metagit tui``)
-    must not call ``asyncio.run()`` on the hub's event loop thread.
-    """
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return app.run()
-
-    result_box: list[Any] = []
-    error_box: list[BaseException] = []
-
-    def _thread_main() -> None:
+    @staticmethod
+    def _preview_text(get_preview: Callable[[Any], Any], item: Any) -> Optional[str]:
+        """Read an item's preview field, or None when it has no such field."""
         try:
-            result_box.append(app.run())
-        except BaseException as exc:
-            error_box.append(exc)
+            return str(get_preview(item))
+        except Exception:
+            return None
 
-    thread = threading.Thread(target=_thread_main, daemon=False)
-    thread.start()
-    thread.join()
-    if error_box:
-        raise error_box[0]
-    return result_box[0] if result_box else None
+    def _resolve_colors(self, items: List[Any], display: List[str]) -> List[Optional[str]]:
+        """Resolve item colors like get_item_color, reusing display strings as custom_colors keys."""
+        if not self.custom_colors or self.color_field:
+            return [self.get_item_color(item) for item in items]
+        lookup = self.custom_colors.get
+        return [
+            item.color if isinstance(item, FuzzyFinderTarget) and item.color else lookup(key)
+            for item, key in zip(items, display, strict=True)
+        ]
 
 
 class FuzzyFinder:
@@ -638,35 +332,54 @@ class FuzzyFinder:
     def run(self) -> Union[Optional[Union[str, List[str], Any]], Exception]:
         """Run the fuzzy finder application."""
         try:
+            from metagit.core.utils.fuzzyfinder_app import FuzzyFinderApp, _run_textual_app
+
             app = FuzzyFinderApp(self.config)
-            result = _run_textual_app(app)
+            return self._finalize_result(_run_textual_app(app))
+        except Exception as e:
+            return e
 
-            if self.config.multi_select:
-                # Multi-select not fully implemented yet
-                return [result] if result else []
-            return result
+    async def run_async(self) -> Union[Optional[Union[str, List[str], Any]], Exception]:
+        """
+        Run the fuzzy finder on the caller's event loop.
+
+        Lets callers that already run asyncio show several finders in a row
+        without starting a new event loop for each one.
+        """
+        try:
+            from metagit.core.utils.fuzzyfinder_app import FuzzyFinderApp
+
+            app = FuzzyFinderApp(self.config)
+            return self._finalize_result(await app.run_async())
         except Exception as e:
             return e
 
+    def _finalize_result(self, result: Any) -> Optional[Union[str, List[str], Any]]:
+        """Shape the app's return value according to the configuration."""
+        if self.config.multi_select:
+            # Multi-select not fully implemented yet
+            return [result] if result else []
+        return result
 
-def fuzzyfinder(query: str, collection: List[str]) -> List[str]:
+
+def fuzzyfinder(query: str, collection: List[str], limit: Optional[int] = None) -> List[str]:
     """
     Simple fuzzy finder function that returns matching items from a collection.
 
     Args:
         query: Search query string
         collection: List of strings to search in
+        limit: Maximum number of matches to return (all matches when None)
 
     Returns:
-        List of matching strings
+        List of matching strings, best matches first
     """
     if not query:
         return collection
 
-    from rapidfuzz import fuzz, process
-
-    # Use rapidfuzz to find matches
-    results = process.extract(query, collection, scorer=fuzz.partial_ratio, limit=len(collection))
-
-    # Return items with score >= 70
-    return [item for item, score, _ in results if score >= 70]
+    # Use rapidfuzz to find items with score >= 70; with a limit it only keeps the top matches
+    # instead of sorting every candidate
+    results = process.extract(
+        query, collection, scorer=fuzz.partial_ratio, processor=None, limit=limit, score_cutoff=70
+    )
+    return [item for item, _, _ in results]
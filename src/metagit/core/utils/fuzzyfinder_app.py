@@ -0,0 +1,556 @@
+#! /usr/bin/env python3
+
+"""
+Textual app behind FuzzyFinder.
+
+Kept apart from the fuzzyfinder module so importing FuzzyFinderConfig and
+FuzzyFinder does not pull in Textual until a finder is actually shown.
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, List, Optional, Tuple, Union
+
+from rapidfuzz import process
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.color import Color
+from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
+from textual.widgets import Input, Label, ListItem, ListView, Static
+
+from metagit.core.utils.fuzzyfinder import _UNIT_SCORERS, FuzzyFinderConfig, _Choices
+
+
+class FuzzyFinderApp(App):
+    """A Textual app for fuzzy finding."""
+
+    CSS = """
+    .fuzzy-finder-input {
+        dock: top;
+        height: 3;
+        border: solid $primary;
+    }
+    
+    .fuzzy-finder-split {
+        height: 1fr;
+    }
+
+    .fuzzy-finder-results {
+        width: 35%;
+        border: solid $primary;
+        scrollbar-gutter: stable;
+        overflow-y: auto;
+        height: 1fr;
+    }
+    
+    .fuzzy-finder-preview {
+        width: 65%;
+        border: solid $primary;
+        overflow-y: auto;
+        height: 1fr;
+    }
+    
+    .highlighted {
+        background: $primary;
+        color: $text;
+    }
+    
+    .list-item-normal {
+        opacity: 1.0;
+    }
+    
+    .list-item-opacity {
+        /* Opacity will be set dynamically */
+    }
+    
+    .list-item-custom-color {
+        /* Custom color will be set dynamically via styles */
+    }
+    """
+
+    BINDINGS = [
+        Binding("ctrl+c", "quit", "Quit"),
+        Binding("escape", "quit", "Quit"),
+        Binding("enter", "select", "Select", priority=True),
+        Binding("up", "cursor_up", "Up", show=False, priority=True),
+        Binding("down", "cursor_down", "Down", show=False, priority=True),
+        Binding("pageup", "page_up", "Page Up", show=False, priority=True),
+        Binding("pagedown", "page_down", "Page Down", show=False, priority=True),
+        Binding("home", "cursor_home", "Home", show=False, priority=True),
+        Binding("end", "cursor_end", "End", show=False, priority=True),
+    ]
+
+    def __init__(self, config: FuzzyFinderConfig, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config
+        self.current_results: List[Any] = []
+        # Positions of current_results in the config's choice lists
+        self._result_indices: List[int] = []
+        self.selected_item: Optional[Any] = None
+        self.highlighted_index = 0
+        # Search scheduled by the latest keystroke, replaced by each new one
+        self._pending_search: Optional[Timer] = None
+        # Rankings by folded query, so retyping a query (e.g. after backspace) skips scoring.
+        # Cleared whenever the config builds new choices.
+        self._ranking_choices: Optional[_Choices] = None
+        self._cached_ranking = functools.lru_cache(maxsize=64)(self._rank_choices)
+        # Preview pane text per choice row, built the first time the row is highlighted
+        self._preview_choices: Optional[_Choices] = None
+        self._cached_preview = functools.lru_cache(maxsize=None)(self._preview_text)
+        # What the results list currently shows, so unchanged results are not rebuilt
+        self._rendered_choices: Optional[_Choices] = None
+        self._rendered_indices: Optional[List[int]] = None
+        self._rendered_highlight: Optional[int] = None
+        self._rendered_count = 0
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets for the app."""
+        with Vertical():
+            # Input field
+            yield Input(
+                placeholder=self.config.prompt_text,
+                id="search_input",
+                classes="fuzzy-finder-input",
+            )
+
+            if self.config.enable_preview:
+                with Horizontal(classes="fuzzy-finder-split"):
+                    yield ListView(id="results_list", classes="fuzzy-finder-results")
+                    yield Static("", id="preview_pane", classes="fuzzy-finder-preview")
+            else:
+                # Just results
+                yield ListView(id="results_list", classes="fuzzy-finder-results")
+            yield Static("", id="results_meta")
+
+    def on_mount(self) -> None:
+        """Called when app starts."""
+        # Initial search with empty query
+        self._perform_search("")
+        # Focus the input
+        self.query_one("#search_input", Input).focus()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Called when the input changes."""
+        if event.input.id != "search_input":
+            return
+        self._cancel_pending_search()
+        if self.config.debounce_seconds <= 0:
+            self._perform_search(event.value)
+            return
+        # Only score the last query of a burst of keystrokes
+        query = event.value
+        self._pending_search = self.set_timer(
+            self.config.debounce_seconds,
+            lambda: self._run_pending_search(query),
+        )
+
+    def _cancel_pending_search(self) -> None:
+        """Drop the search scheduled by a previous keystroke, if any."""
+        if self._pending_search is not None:
+            self._pending_search.stop()
+            self._pending_search = None
+
+    def _run_pending_search(self, query: str) -> None:
+        """Run the debounced search for the latest query."""
+        self._pending_search = None
+        self._perform_search(query)
+
+    def _flush_pending_search(self) -> None:
+        """Run a scheduled search right away so results match the input."""
+        if self._pending_search is None:
+            return
+        self._cancel_pending_search()
+        self._perform_search(self.query_one("#search_input", Input).value)
+
+    def _perform_search(self, query: str) -> None:
+        """Perform fuzzy search and update results."""
+        try:
+            indices = self._search_indices(query)
+            if isinstance(indices, Exception):
+                # Handle error - for now just show empty results
+                indices = []
+
+            choices = self.config.get_choices()
+            self._result_indices = indices
+            self.current_results = [] if isinstance(choices, Exception) else [choices.items[i] for i in indices]
+            self.highlighted_index = 0
+            self._update_results_list()
+            self._update_results_meta(query)
+
+            if self.config.enable_preview:
+                self._update_preview()
+
+        except Exception:
+            # Handle error gracefully
+            self.current_results = []
+            self._result_indices = []
+            self._update_results_list()
+            self._update_results_meta(query)
+
+    def _update_results_meta(self, query: str) -> None:
+        """Show concise result counters for current query."""
+        try:
+            meta = self.query_one("#results_meta", Static)
+            shown_count = len(self.current_results)
+            total_count = self.config.total_count if self.config.total_count is not None else len(self.config.items)
+            cap_count = self.config.max_results
+            mode_label = self.config.query_mode_label
+            query_label = query if query else "all"
+            meta.update(f"Showing {shown_count}/{total_count} ({mode_label}, limit={cap_count}) | query: {query_label}")
+        except Exception:
+            return
+
+    def _update_results_list(self) -> None:
+        """Update the results ListView."""
+        results_list = self.query_one("#results_list", ListView)
+        choices = self.config.get_choices()
+        if choices is self._rendered_choices and self._result_indices == self._rendered_indices:
+            # Same rows as on screen (cursor moves, queries with unchanged matches): only move the highlight,
+            # building further rows if the cursor moved past the ones shown so far
+            self._append_rows(results_list, choices)
+            self._move_highlight(results_list)
+            return
+
+        results_list.clear()
+        self._rendered_choices = None
+        self._rendered_indices = None
+        self._rendered_count = 0
+        if isinstance(choices, Exception):
+            return
+
+        self._append_rows(results_list, choices)
+        self._rendered_choices = choices
+        self._rendered_indices = list(self._result_indices)
+        self._rendered_highlight = self.highlighted_index
+
+        # Set the ListView's index to match our highlighted_index
+        if self.current_results and 0 <= self.highlighted_index < len(self.current_results):
+            results_list.index = self.highlighted_index
+
+    def _append_rows(self, results_list: ListView, choices: _Choices) -> None:
+        """
+        Build result rows through the highlighted one, max_results rows at a time.
+
+        Rows past the window around the cursor are only built once the cursor reaches
+        them, so a short query over a large list does not create a widget per match.
+        """
+        window = self.config.max_results
+        stop = min(len(self._result_indices), (self.highlighted_index // window + 1) * window)
+        for i in range(self._rendered_count, stop):
+            index = self._result_indices[i]
+            # Create list item
+            item = ListItem(Label(choices.display[index]))
+
+            # Apply highlighting
+            if i == self.highlighted_index:
+                item.add_class("highlighted")
+
+            # Apply custom color if configured
+            custom_style = choices.styles[index]
+            if custom_style:
+                item.add_class("list-item-custom-color")
+                # Apply the colors compiled when the choices were built
+                self._apply_custom_color(item, custom_style)
+
+            # Apply opacity - prioritize FuzzyFinderTarget.opacity over config.item_opacity
+            item_opacity = choices.opacities[index]
+            if item_opacity is not None:
+                item.add_class("list-item-opacity")
+                # Set opacity via inline style
+                item.styles.opacity = item_opacity
+            else:
+                item.add_class("list-item-normal")
+
+            results_list.append(item)
+        self._rendered_count = max(self._rendered_count, stop)
+
+    def _move_highlight(self, results_list: ListView) -> None:
+        """Move the highlighted class to highlighted_index on the rows already shown."""
+        rows = results_list.children
+        if self._rendered_highlight != self.highlighted_index:
+            if self._rendered_highlight is not None and self._rendered_highlight < len(rows):
+                rows[self._rendered_highlight].remove_class("highlighted")
+            if self.highlighted_index < len(rows):
+                rows[self.highlighted_index].add_class("highlighted")
+            self._rendered_highlight = self.highlighted_index
+
+        if self.current_results and 0 <= self.highlighted_index < len(self.current_results):
+            results_list.index = self.highlighted_index
+
+    def _apply_custom_color(self, item: ListItem, style: Tuple[Optional[Color], Optional[Color]]) -> None:
+        """Apply compiled custom colors to a list item."""
+        text_color, bg_color = style
+        if text_color is not None:
+            item.styles.color = text_color
+        if bg_color is not None:
+            item.styles.background = bg_color
+
+    def _update_preview(self) -> None:
+        """Update the preview pane."""
+        if not self.config.enable_preview:
+            return
+
+        preview_pane = self.query_one("#preview_pane", Static)
+
+        choices = self.config.get_choices()
+        if (
+            isinstance(choices, Exception)
+            or not self._result_indices
+            or self.highlighted_index >= len(self._result_indices)
+        ):
+            preview_pane.update("No preview available")
+            return
+
+        if choices is not self._preview_choices:
+            self._cached_preview.cache_clear()
+            self._preview_choices = choices
+        preview_pane.update(self._cached_preview(self._result_indices[self.highlighted_index]))
+
+    def _preview_text(self, index: int) -> str:
+        """Build the preview pane text for one choice row."""
+        choices = self._preview_choices
+        if choices is None:
+            raise ValueError("Choices must be prepared before building previews.")
+        preview_value = choices.preview[index]
+
+        if preview_value is None:
+            preview_value = str(choices.items[index])
+
+        if self.config.preview_header:
+            return f"{self.config.preview_header}\n\n{preview_value}"
+        return preview_value
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Called when a list item is selected."""
+        if event.list_view.id == "results_list" and self.current_results:
+            # Update highlighted index based on selection
+            results_list = self.query_one("#results_list", ListView)
+            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
+                self.highlighted_index = results_list.index
+                self.selected_item = self.current_results[self.highlighted_index]
+                self.exit(self.selected_item)
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Called when a list item is highlighted (but not selected)."""
+        if event.list_view.id == "results_list" and self.current_results:
+            # Keep our highlighted_index in sync with ListView
+            results_list = self.query_one("#results_list", ListView)
+            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
+                self.highlighted_index = results_list.index
+                if self.config.enable_preview:
+                    self._update_preview()
+
+    def action_cursor_up(self) -> None:
+        """Move cursor up."""
+        if self.current_results and self.highlighted_index > 0:
+            self.highlighted_index -= 1
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def action_cursor_down(self) -> None:
+        """Move cursor down."""
+        if self.current_results and self.highlighted_index < len(self.current_results) - 1:
+            self.highlighted_index += 1
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def _scroll_to_highlighted(self) -> None:
+        """Scroll the results list to ensure the highlighted item is visible."""
+        try:
+            results_list = self.query_one("#results_list", ListView)
+            if self.highlighted_index < len(results_list.children):
+                # Get the highlighted list item
+                highlighted_item = results_list.children[self.highlighted_index]
+                # Scroll to make the item visible
+                results_list.scroll_to_widget(highlighted_item)
+        except Exception:
+            # If scrolling fails, continue without it
+            pass
+
+    def action_page_up(self) -> None:
+        """Move cursor up by a page (10 items)."""
+        if self.current_results:
+            page_size = 10
+            self.highlighted_index = max(0, self.highlighted_index - page_size)
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def action_page_down(self) -> None:
+        """Move cursor down by a page (10 items)."""
+        if self.current_results:
+            page_size = 10
+            max_index = len(self.current_results) - 1
+            self.highlighted_index = min(max_index, self.highlighted_index + page_size)
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def action_cursor_home(self) -> None:
+        """Move cursor to the first item."""
+        if self.current_results:
+            self.highlighted_index = 0
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def action_cursor_end(self) -> None:
+        """Move cursor to the last item."""
+        if self.current_results:
+            self.highlighted_index = len(self.current_results) - 1
+            self._update_results_list()
+            self._scroll_to_highlighted()
+            if self.config.enable_preview:
+                self._update_preview()
+
+    def action_select(self) -> None:
+        """Select the highlighted item."""
+        # Results must reflect everything typed before Enter
+        self._flush_pending_search()
+
+        # First try to get the current selection from the ListView
+        try:
+            results_list = self.query_one("#results_list", ListView)
+            if results_list.index is not None and 0 <= results_list.index < len(self.current_results):
+                self.highlighted_index = results_list.index
+        except Exception:
+            pass
+
+        # Select the highlighted item
+        if self.current_results and self.highlighted_index < len(self.current_results):
+            self.selected_item = self.current_results[self.highlighted_index]
+            self.exit(self.selected_item)
+        else:
+            self.exit(None)
+
+    def action_quit(self) -> None:
+        """Quit the application."""
+        self.exit(None)
+
+    def _search(self, query: str) -> Union[List[Any], Exception]:
+        """Perform fuzzy search based on the query."""
+        indices = self._search_indices(query)
+        if isinstance(indices, Exception):
+            return indices
+        choices = self.config.get_choices()
+        if isinstance(choices, Exception):
+            return choices
+        return [choices.items[i] for i in indices]
+
+    def _search_indices(self, query: str) -> Union[List[int], Exception]:
+        """Return the positions of matching choices, best matches first."""
+        try:
+            choices = self.config.get_choices()
+            if isinstance(choices, Exception):
+                return choices
+
+            if not query:
+                return list(range(len(choices.items)))
+
+            if choices is not self._ranking_choices:
+                self._cached_ranking.cache_clear()
+                self._ranking_choices = choices
+
+            # Fold the query once; the choices were folded when they were built
+            query_lower = query if self.config.case_sensitive else query.casefold()
+            return list(self._cached_ranking(query_lower))
+
+        except Exception as e:
+            return e
+
+    def _rank_choices(self, query_lower: str) -> Tuple[int, ...]:
+        """Score the choices against a folded query and return matching positions in rank order."""
+        choices = self._ranking_choices
+        if choices is None:
+            raise ValueError("Choices must be prepared before ranking.")
+        scorer_func = self.config.get_scorer_function()
+        if isinstance(scorer_func, Exception):
+            raise scorer_func
+
+        candidates: List[Optional[str]] = choices.folded
+        results = []
+        if self.config.scorer == "partial_ratio":
+            # A choice containing the query always scores 100 with partial_ratio, so
+            # only the remaining choices need the fuzzy scorer (None entries are skipped)
+            candidates = [None if query_lower in choice else choice for choice in choices.folded]
+            results = [(choices.folded[i], 100.0, i) for i, choice in enumerate(candidates) if choice is None]
+
+        scale = 100.0 if self.config.scorer in _UNIT_SCORERS else 1.0
+        # Get fuzzy search results; the cutoff lets rapidfuzz skip weak candidates early
+        matches = process.extract(
+            query_lower,
+            candidates,
+            scorer=scorer_func,
+            processor=None,  # Choices are already folded, no per-call preprocessing
+            limit=None,  # Get all results for custom sorting
+            score_cutoff=self.config.score_threshold / scale,
+        )
+        if scale != 1.0:
+            matches = [(choice, score * scale, index) for choice, score, index in matches]
+        results += matches
+
+        # Custom scoring and sorting to prioritize exact matches
+        scored_results = []
+        for choice_lower, score, index in results:
+            if score < self.config.score_threshold:
+                continue
+
+            # Calculate custom score based on match type
+            custom_score = score
+
+            # Bonus for exact matches
+            if choice_lower == query_lower:
+                custom_score += 1000
+            # Bonus for prefix matches
+            elif choice_lower.startswith(query_lower):
+                custom_score += 500
+            # Bonus for longer matches (more specific)
+            elif len(choice_lower) > len(query_lower):
+                length_bonus = min(100, (len(choice_lower) - len(query_lower)) * 10)
+                custom_score += length_bonus
+
+            scored_results.append((custom_score, choice_lower, index))
+
+        # Sort by custom score (highest first) and then by original string length (shorter first for same score)
+        scored_results.sort(key=lambda x: (-x[0], len(x[1])))
+
+        # Return all matched results to allow full manual scrolling.
+        return tuple(item[2] for item in scored_results)
+
+
+def _run_textual_app(app: App) -> Any:
+    """
+    Run a Textual app even when the caller already has a running asyncio loop.
+
+    Nested Textual apps (for example the repo picker launched from ``metagit tui``)
+    must not call ``asyncio.run()`` on the hub's event loop thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return app.run()
+
+    result_box: list[Any] = []
+    error_box: list[BaseException] = []
+
+    def _thread_main() -> None:
+        try:
+            result_box.append(app.run())
+        except BaseException as exc:
+            error_box.append(exc)
+
+    thread = threading.Thread(target=_thread_main, daemon=False)
+    thread.start()
+    thread.join()
+    if error_box:
+        raise error_box[0]
+    return result_box[0] if result_box else None
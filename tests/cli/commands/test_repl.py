@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+"""
+CLI tests for metagit repl command.
+"""
+
+from click.testing import CliRunner
+
+from metagit.cli.main import cli
+
+
+def test_repl_runs_each_line_and_reports_exit_codes() -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["repl", "--delimiter", "@@DONE"],
+        input="skills list\n\n# comment\nno-such-command\nquit\nskills list\n",
+    )
+    assert result.exit_code == 0
+    assert "metagit-gitnexus" in result.stdout
+    markers = [line for line in result.stdout.splitlines() if line.startswith("@@DONE")]
+    assert markers == ["@@DONE 0", "@@DONE 2"]
+
+
+def test_repl_reports_unbalanced_quotes() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli, ["repl"], input='search "unterminated\n')
+    assert result.exit_code == 0
+    assert "__METAGIT_DONE__ 2" in result.stdout
+    assert "Invalid command line" in result.stderr
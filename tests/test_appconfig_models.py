@@ -122,3 +122,15 @@ def test_appconfig_load_ignores_legacy_version_key(tmp_path):
     cfg = AppConfig.load(config_path)
     assert isinstance(cfg, AppConfig)
     assert cfg.description == "legacy"
+
+
+def test_appconfig_load_rereads_changed_file(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"config": {"description": "first"}}), encoding="utf-8")
+    first = AppConfig.load(str(config_path))
+    again = AppConfig.load(str(config_path))
+    assert first.description == again.description == "first"
+    assert first is not again
+
+    config_path.write_text(yaml.dump({"config": {"description": "second one"}}), encoding="utf-8")
+    assert AppConfig.load(str(config_path)).description == "second one"
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+"""
+Unit tests for DetectionManager.run_all
+"""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from metagit.core.detect.manager import DetectionManager
+from metagit.core.detect.models import DetectionManagerConfig
+
+
+@pytest.fixture
+def git_project(tmp_path):
+    (tmp_path / "README.md").write_text("# demo\nA demo project\n")
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-qm", "init"],
+        cwd=tmp_path,
+        check=True,
+    )
+    return tmp_path
+
+
+def test_run_all_collects_concurrent_results(git_project):
+    manager = DetectionManager.from_path(str(git_project))
+    assert manager.run_all() is None
+    assert manager.analysis_completed is True
+    assert manager.language_detection.primary == "Python"
+    assert manager.project_type_detection is not None
+    assert [b.name for b in manager.branch_analysis.branches]
+    assert manager.directory_summary.num_files == 2
+    assert manager.directory_details.num_files == 2
+
+
+def test_run_all_skips_disabled_analyses(git_project):
+    config = DetectionManagerConfig.minimal().copy_with(branch_analysis_enabled=False)
+    manager = DetectionManager.from_path(str(git_project), config=config)
+    assert manager.run_all() is None
+    assert manager.branch_analysis is None
+    assert manager.directory_summary is None
+    assert manager.directory_details is None
+    assert manager.language_detection is not None
+
+
+def test_run_all_skips_unimplemented_enabled_methods(git_project):
+    manager = DetectionManager.from_path(str(git_project), config=DetectionManagerConfig.all_enabled())
+    assert manager.run_all() is None
+    assert manager.directory_summary.num_files == 2
+    assert isinstance(manager.run_specific("commit_analysis"), Exception)
+
+
+def test_from_url_shallow_clone_and_cleanup(git_project, tmp_path_factory):
+    subprocess.run(["git", "branch", "develop"], cwd=git_project, check=True)
+    subprocess.run(["git", "config", "uploadpack.allowFilter", "true"], cwd=git_project, check=True)
+    temp_dir = str(tmp_path_factory.mktemp("clone") / "repo")
+    manager = DetectionManager.from_url(f"file://{git_project}", temp_dir=temp_dir)
+    assert not isinstance(manager, Exception)
+    assert manager.run_all() is None
+    remote_names = {b.name for b in manager.branch_analysis.branches if b.is_remote}
+    assert "develop" in remote_names
+    # Partial clone: file contents are fetched lazily from the promisor remote
+    promisor = subprocess.run(
+        ["git", "config", "remote.origin.promisor"], cwd=temp_dir, capture_output=True, text=True
+    )
+    assert promisor.stdout.strip() == "true"
+    manager.cleanup()
+    assert not os.path.exists(temp_dir)
+
+
+def test_large_readme_is_not_read(git_project):
+    config = DetectionManagerConfig(large_file_threshold_bytes=4)
+    manager = DetectionManager.from_path(str(git_project), config=config)
+    manager._extract_metadata()
+    assert manager.description == "No description"
+
+    manager = DetectionManager.from_path(str(git_project))
+    manager._extract_metadata()
+    assert manager.description == "A demo project"
+
+
+def test_run_all_reuses_cached_result_for_clean_head(git_project, tmp_path_factory, monkeypatch):
+    config = DetectionManagerConfig(result_cache_dir=str(tmp_path_factory.mktemp("cache")))
+    first = DetectionManager.from_path(str(git_project), config=config)
+    assert first.run_all() is None
+
+    def fail(_self):
+        raise AssertionError("analysis should have been served from the cache")
+
+    monkeypatch.setattr(DetectionManager, "_run_analyses_concurrently", fail)
+    second = DetectionManager.from_path(str(git_project), config=config)
+    assert second.run_all() is None
+    assert second.language_detection == first.language_detection
+    assert second.directory_summary == first.directory_summary
+
+    # Untracked files make the tree dirty, so the cache is bypassed
+    (git_project / "new.py").write_text("x = 1\n")
+    third = DetectionManager.from_path(str(git_project), config=config)
+    # run_all sets is_git_repo before picking a cache file
+    third.is_git_repo = True
+    assert third._result_cache_file() is None
+    (git_project / "new.py").unlink()
+    assert third._result_cache_file() is not None
+
+
+def test_run_all_cache_tracks_gitignored_files(git_project, tmp_path_factory):
+    (git_project / ".gitignore").write_text("gen/\n")
+    subprocess.run(["git", "add", ".gitignore"], cwd=git_project, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-qm", "ignore"],
+        cwd=git_project,
+        check=True,
+    )
+    config = DetectionManagerConfig(result_cache_dir=str(tmp_path_factory.mktemp("cache")))
+    first = DetectionManager.from_path(str(git_project), config=config)
+    assert first.run_all() is None
+    assert first._result_cache_file() is not None
+    assert first.language_detection.primary == "Python"
+
+    gen = git_project / "gen"
+    gen.mkdir()
+    for name in ("a.go", "b.go", "c.go"):
+        (gen / name).write_text("package gen\n")
+    second = DetectionManager.from_path(str(git_project), config=config)
+    assert second.run_all() is None
+    assert second._result_cache_file() is None
+    # Language detection walks ignored directories, so the new files change the result
+    assert second.language_detection.primary == "Go"
+
+
+def test_run_all_cache_tracks_gitignored_files_in_pruned_dirs(git_project, tmp_path_factory):
+    (git_project / ".gitignore").write_text("node_modules/\n")
+    subprocess.run(["git", "add", ".gitignore"], cwd=git_project, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-qm", "ignore"],
+        cwd=git_project,
+        check=True,
+    )
+    config = DetectionManagerConfig(result_cache_dir=str(tmp_path_factory.mktemp("cache")))
+    first = DetectionManager.from_path(str(git_project), config=config)
+    assert first.run_all() is None
+    assert first._result_cache_file() is not None
+    assert first.has_tests is False
+
+    # The file analysis globs into pruned directories too, so they still bypass the cache
+    package = git_project / "node_modules" / "pkg"
+    package.mkdir(parents=True)
+    (package / "README.md").write_text("# pkg\n")
+    (package / "test_pkg.py").write_text("")
+    second = DetectionManager.from_path(str(git_project), config=config)
+    assert second.run_all() is None
+    assert second._result_cache_file() is None
+    assert second.has_tests is True
+    assert str(package / "README.md") in second.detected_files["docs"]
+    assert str(package / "test_pkg.py") in second.detected_files["tests"]
+
+
+def test_ci_config_analysis_matches_workflow_glob(git_project):
+    workflows = git_project / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "a.yml").write_text("on: push\njobs:\n  test:\n    runs-on: ubuntu-latest\n")
+    (workflows / "b.yml").write_text("workflow: release\n")
+    manager = DetectionManager.from_path(str(git_project))
+    analysis = manager._ci_config_analysis()
+    assert analysis.detected_tool == "GitHub Actions"
+    assert analysis.ci_config_path == str(workflows / "a.yml")
+    assert "workflow: release" in analysis.config_content
+
+
+def test_detect_languages_counts_extensions(git_project):
+    (git_project / "b.py").write_text("")
+    (git_project / "index.js").write_text("")
+    (git_project / "package.json").write_text("{}")
+    (git_project / "requirements.txt").write_text("")
+    manager = DetectionManager.from_path(str(git_project))
+    detection = manager._detect_languages()
+    assert detection.primary == "Python"
+    assert detection.secondary == ["JavaScript"]
+    assert sorted(detection.package_managers) == ["npm", "pip"]
+
+
+def test_to_yaml_and_json_stream_and_preview(git_project):
+    manager = DetectionManager.from_path(str(git_project))
+    assert manager.run_all() is None
+    full_yaml = manager.to_yaml()
+    stream = io.StringIO()
+    assert manager.to_yaml(stream) is None
+    assert stream.getvalue() == full_yaml
+    assert manager.to_yaml_preview(50) == full_yaml[:50] + "..."
+
+    full_json = manager.to_json()
+    stream = io.StringIO()
+    assert manager.to_json(stream) is None
+    assert stream.getvalue() == full_json
+    assert manager.to_json_preview(50) == full_json[:50] + "..."
+    assert manager.to_json_preview(len(full_json)) == full_json
+
+
+def test_from_path_loads_existing_config(git_project):
+    (git_project / ".metagit.yml").write_text("name: configured-name\ndescription: From config\n")
+    manager = DetectionManager.from_path(str(git_project))
+    assert manager.name == "configured-name"
+    assert manager.description == "From config"
+
+
+def test_run_all_opens_repository_once(git_project, monkeypatch):
+    import git
+
+    opened = []
+    real_repo = git.Repo
+
+    def counting_repo(path):
+        opened.append(path)
+        return real_repo(path)
+
+    monkeypatch.setattr(git, "Repo", counting_repo)
+    manager = DetectionManager.from_path(str(git_project))
+    assert manager.run_all() is None
+    assert manager.branch_analysis is not None
+    assert manager.metrics is not None
+    assert opened == [str(git_project)]
+
+
+def test_manager_import_does_not_load_gitpython():
+    code = "import sys, metagit.core.detect.manager; print('git' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
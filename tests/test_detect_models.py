@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Unit tests for metagit.core.detect.models
+"""
+
+import pytest
+
+from metagit.core.detect.models import DetectionManagerConfig
+
+
+def test_get_enabled_methods_defaults():
+    config = DetectionManagerConfig()
+    assert config.get_enabled_methods() == [
+        "branch_analysis",
+        "ci_config_analysis",
+        "directory_summary",
+        "directory_details",
+    ]
+    assert DetectionManagerConfig.all_enabled().get_enabled_methods() == list(DetectionManagerConfig.ANALYSIS_METHODS)
+
+
+def test_get_enabled_methods_tracks_flag_changes():
+    config = DetectionManagerConfig.minimal()
+    assert config.get_enabled_methods() == ["branch_analysis", "ci_config_analysis"]
+    config.tag_analysis_enabled = True
+    assert config.get_enabled_methods() == ["branch_analysis", "ci_config_analysis", "tag_analysis"]
+    copied = config.model_copy(update={"branch_analysis_enabled": False})
+    assert copied.get_enabled_methods() == ["ci_config_analysis", "tag_analysis"]
+
+
+def test_get_enabled_methods_returns_fresh_list():
+    config = DetectionManagerConfig()
+    config.get_enabled_methods().append("mutated")
+    assert "mutated" not in config.get_enabled_methods()
+
+
+def test_enabled_methods_tracks_flag_changes():
+    config = DetectionManagerConfig()
+    config.directory_details_enabled = False
+    assert config.enabled_methods == ("branch_analysis", "ci_config_analysis", "directory_summary")
+
+
+def test_copy_with_updates_flags_without_touching_original():
+    config = DetectionManagerConfig()
+    copied = config.copy_with(branch_analysis_enabled=False, tag_analysis_enabled=True)
+    assert copied.get_enabled_methods() == [
+        "ci_config_analysis",
+        "directory_summary",
+        "directory_details",
+        "tag_analysis",
+    ]
+    assert config.branch_analysis_enabled is True
+
+
+def test_copy_with_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="not_a_flag"):
+        DetectionManagerConfig().copy_with(not_a_flag=True)
+
+
+def test_default_config_dumps_nothing_without_defaults():
+    assert DetectionManagerConfig().model_dump(exclude_defaults=True) == {}
+    config = DetectionManagerConfig(prune_dirs=frozenset({"vendor", "build"}))
+    assert sorted(config.model_dump(mode="json", exclude_defaults=True)["prune_dirs"]) == ["build", "vendor"]
@@ -6,9 +6,13 @@ This module contains comprehensive tests for the GitCacheConfig,
 GitCacheEntry, and GitCacheManager classes.
 """
 
+import asyncio
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -22,6 +26,7 @@ from metagit.core.gitcache.config import (
     GitCacheConfig,
     GitCacheEntry,
 )
+from metagit.core.gitcache import manager as gitcache_manager
 from metagit.core.gitcache.manager import GitCacheManager
 
 test_repo_url = "https://github.com/metagit-ai/metagit-detect.git"
@@ -313,6 +318,60 @@ class TestGitCacheManager(unittest.TestCase):
         self.assertTrue((cache_path / "test.txt").exists())
         self.assertEqual((cache_path / "test.txt").read_text(), "test content")
 
+    def test_git_cache_manager_copy_local_directory_is_independent(self):
+        """Test cached local files do not follow later edits to the source."""
+        source_dir = Path.joinpath(Path(self.temp_dir), "source")
+        (source_dir / "nested").mkdir(parents=True)
+        (source_dir / "nested" / "test.txt").write_text("original")
+
+        cache_path = Path.joinpath(Path(self.temp_dir), "cache_copy")
+        self.assertTrue(self.manager._copy_local_directory(source_dir, cache_path))
+
+        (source_dir / "nested" / "test.txt").write_text("changed")
+        self.assertEqual((cache_path / "nested" / "test.txt").read_text(), "original")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "named pipes not supported")
+    def test_git_cache_manager_copy_local_directory_named_pipe_fails_fast(self):
+        """Test a named pipe in the source is rejected instead of blocking the copy."""
+        source_dir = Path.joinpath(Path(self.temp_dir), "source")
+        source_dir.mkdir()
+        (source_dir / "test.txt").write_text("test content")
+        os.mkfifo(source_dir / "pipe")
+
+        cache_path = Path.joinpath(Path(self.temp_dir), "cache_copy")
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(self.manager._copy_local_directory(source_dir, cache_path)),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        self.assertFalse(worker.is_alive(), "copy blocked on the named pipe")
+        self.assertIsInstance(results[0], Exception)
+        self.assertIn("named pipe", str(results[0]))
+
+    @unittest.skipUnless(
+        gitcache_manager.fcntl is not None and hasattr(gitcache_manager.fcntl, "FICLONE"),
+        "reflinks not supported",
+    )
+    def test_git_cache_manager_copy_local_directory_stops_reflinking_after_refusal(self):
+        """Test files are copied normally once the filesystem refuses a reflink."""
+        source_dir = Path.joinpath(Path(self.temp_dir), "source")
+        source_dir.mkdir()
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (source_dir / name).write_text(name)
+
+        cache_path = Path.joinpath(Path(self.temp_dir), "cache_copy")
+        refused = OSError(95, "Operation not supported")
+        with patch.object(gitcache_manager.fcntl, "ioctl", side_effect=refused) as mock_ioctl:
+            result = self.manager._copy_local_directory(source_dir, cache_path)
+
+        self.assertTrue(result)
+        mock_ioctl.assert_called_once()
+        for name in ("a.txt", "b.txt", "c.txt"):
+            self.assertEqual((cache_path / name).read_text(), name)
+
     def test_git_cache_manager_copy_local_directory_failure(self):
         """Test local directory copying failure."""
         non_existent_path = Path("/non/existent/path")
@@ -332,6 +391,28 @@ class TestGitCacheManager(unittest.TestCase):
         size = self.manager._calculate_directory_size(test_dir)
         self.assertGreater(size, 0)
 
+    def test_git_cache_manager_cache_stats_sums_entry_sizes(self):
+        """Test cache statistics add up nested file sizes across entries."""
+        for name, files in (("repo1", {"a.txt": "12345"}), ("repo2", {"sub/b.txt": "123", "c.txt": "1"})):
+            for rel_path, content in files.items():
+                file_path = self.config.get_cache_path(name) / rel_path
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text(content)
+            self.config.add_entry(
+                GitCacheEntry(
+                    name=name,
+                    source_url=f"https://github.com/test/{name}.git",
+                    cache_type=CacheType.GIT,
+                    cache_path=self.config.get_cache_path(name),
+                )
+            )
+
+        stats = self.manager.get_cache_stats()
+
+        self.assertEqual(stats["total_size_bytes"], 9)
+        self.assertEqual(stats["total_size_gb"], 9 / (1024**3))
+        self.assertFalse(stats["cache_full"])
+
     def test_git_cache_manager_cache_stats(self):
         """Test cache statistics."""
         # Add some test entries
@@ -411,6 +492,39 @@ class TestGitCacheManager(unittest.TestCase):
         self.assertEqual(result.cache_type, CacheType.LOCAL)
         self.assertEqual(result.source_url, str(git_dir))
 
+    def test_check_repository_differences_counts_both_sides(self):
+        """Test ahead/behind counts between a local clone and its origin."""
+        origin_dir = Path(self.temp_dir) / "origin"
+        origin_dir.mkdir()
+        origin = git.Repo.init(origin_dir, initial_branch="main")
+        with origin.config_writer() as writer:
+            writer.set_value("user", "name", "test")
+            writer.set_value("user", "email", "test@example.com")
+        (origin_dir / "a.txt").write_text("a")
+        origin.index.add(["a.txt"])
+        origin.index.commit("initial")
+
+        clone_dir = Path(self.temp_dir) / "clone"
+        clone = git.Repo.clone_from(str(origin_dir), clone_dir)
+        with clone.config_writer() as writer:
+            writer.set_value("user", "name", "test")
+            writer.set_value("user", "email", "test@example.com")
+        (clone_dir / "local.txt").write_text("local")
+        clone.index.add(["local.txt"])
+        clone.index.commit("local change")
+
+        for name in ("b.txt", "c.txt"):
+            (origin_dir / name).write_text(name)
+            origin.index.add([name])
+            origin.index.commit(f"add {name}\n\nbody")
+
+        result = self.manager._check_repository_differences(clone_dir)
+        self.assertTrue(result["has_changes"])
+        self.assertEqual(
+            result["changes_summary"],
+            "Remote is 2 commits ahead, local is 1 commits ahead. Latest remote commit: add c.txt",
+        )
+
 
 class TestGitCacheManagerAsync(unittest.IsolatedAsyncioTestCase):
     """Test cases for GitCacheManager async operations."""
@@ -444,6 +558,31 @@ class TestGitCacheManagerAsync(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(result)
         # mock_create_subprocess.assert_called_once()
 
+    async def test_git_cache_manager_clone_repository_async_limits_concurrency(self):
+        """Test async clones never exceed max_parallel_clones."""
+        config = GitCacheConfig(cache_root=self.cache_root, max_parallel_clones=2)
+        manager = GitCacheManager(config)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def _fake_clone(url, cache_path):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(url)
+            return True
+
+        with patch.object(manager, "_clone_repository", side_effect=_fake_clone):
+            results = await asyncio.gather(
+                *(manager._clone_repository_async(f"repo-{i}", Path(self.temp_dir) / f"r{i}") for i in range(6))
+            )
+
+        self.assertEqual(results, [True] * 6)
+        self.assertLessEqual(max(peak), 2)
+
     @patch("metagit.core.gitcache.manager.git.Repo.clone_from")
     async def test_git_cache_manager_clone_repository_async_failure(
         self, mock_clone_from
@@ -482,6 +621,33 @@ class TestGitCacheManagerAsync(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsInstance(result, Exception)
 
+    async def test_check_repository_differences_async_matches_sync(self):
+        """Test the concurrent difference check reports the same as the sync one."""
+        origin_dir = Path(self.temp_dir) / "origin"
+        origin_dir.mkdir()
+        origin = git.Repo.init(origin_dir, initial_branch="main")
+        with origin.config_writer() as writer:
+            writer.set_value("user", "name", "test")
+            writer.set_value("user", "email", "test@example.com")
+        (origin_dir / "a.txt").write_text("a")
+        origin.index.add(["a.txt"])
+        origin.index.commit("initial")
+
+        clone_dir = Path(self.temp_dir) / "clone"
+        git.Repo.clone_from(str(origin_dir), clone_dir)
+        (origin_dir / "b.txt").write_text("b")
+        origin.index.add(["b.txt"])
+        origin.index.commit("add b.txt")
+
+        result = await self.manager._check_repository_differences_async(clone_dir)
+        self.assertTrue(result["has_changes"])
+        self.assertEqual(result["remote_info"]["branch"], "main")
+        self.assertEqual(
+            result["changes_summary"],
+            "Remote is 1 commits ahead, local is 0 commits ahead. Latest remote commit: add b.txt",
+        )
+        self.assertEqual(result, self.manager._check_repository_differences(clone_dir))
+
     @patch("metagit.core.gitcache.manager.GitCacheManager._clone_repository_async")
     async def test_git_cache_manager_cache_repository_async(self, mock_clone):
         """Test async repository caching."""
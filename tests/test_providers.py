@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+"""
+Unit tests for metagit.core.providers.ProviderRegistry
+"""
+
+from metagit.core.providers import ProviderRegistry
+from metagit.core.providers.github import GitHubProvider
+from metagit.core.providers.gitlab import GitLabProvider
+
+
+def test_provider_names_empty_registry():
+    assert ProviderRegistry().provider_names() == []
+
+
+def test_provider_names_follow_registration_order():
+    registry = ProviderRegistry()
+    registry.register(GitLabProvider(api_token="gl-token"))
+    registry.register(GitHubProvider(api_token="gh-token"))
+    assert registry.provider_names() == ["GitLab", "GitHub"]
+
+    registry.unregister("GitLab")
+    assert registry.provider_names() == ["GitHub"]
+    registry.clear()
+    assert registry.provider_names() == []
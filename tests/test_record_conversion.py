@@ -123,6 +123,15 @@ class TestMetagitRecordConversion(unittest.TestCase):
         self.assertFalse(hasattr(config, "detection_source"))
         self.assertFalse(hasattr(config, "detection_version"))
 
+    def test_to_metagit_config_skips_defaulted_fields(self):
+        """Test fields left at the record's defaults fall back to MetagitConfig's defaults."""
+        record = MetagitRecord(name="defaults", description=None, maintainers=[], branch="main")
+        config = record.to_metagit_config()
+
+        self.assertEqual(config.model_fields_set, {"name"})
+        self.assertIsNone(config.maintainers)
+        self.assertEqual(config.description, "No description")
+
     def test_to_metagit_config_with_detection_fields(self):
         """Test conversion keeping detection fields."""
         # This test is removed because MetagitConfig doesn't support detection fields
@@ -151,6 +160,13 @@ class TestMetagitRecordConversion(unittest.TestCase):
         self.assertIn("detection_source", differences["record_only_fields"])
         self.assertIn("detection_version", differences["record_only_fields"])
 
+    def test_compatible_fields_are_a_fresh_set(self):
+        """Test callers can modify compatible fields without affecting later calls."""
+        compatible_fields = MetagitRecord.get_compatible_fields()
+        compatible_fields.discard("name")
+
+        self.assertIn("name", MetagitRecord.get_compatible_fields())
+
     def test_compatible_fields(self):
         """Test compatible field detection."""
         compatible_fields = MetagitRecord.get_compatible_fields()
@@ -3,6 +3,10 @@
 Unit tests for metagit.core.utils.files
 """
 
+from pathlib import Path
+
+from git import Repo
+
 from metagit.core.utils import files
 
 
@@ -77,3 +81,84 @@ def test_remove_dir(tmp_path):
     d.mkdir()
     assert files.remove_dir(str(d)) is True
     assert files.remove_dir(str(d)) is False
+
+
+def test_directory_summary(tmp_path):
+    (tmp_path / "a.py").write_text("x")
+    (tmp_path / "b.py").write_text("x")
+    (tmp_path / "Makefile").write_text("x")
+    (tmp_path / ".gitignore").write_text("ignored\n")
+    (tmp_path / "ignored").mkdir()
+    (tmp_path / "ignored" / "c.py").write_text("x")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "d.tar.gz").write_text("x")
+    summary = files.directory_summary(str(tmp_path))
+    assert summary.num_files == 4
+    counts = {ft.type: ft.count for ft in summary.file_types}
+    assert counts == {"py": 2, "Makefile": 1, ".gitignore": 1}
+    assert len(summary.subpaths) == 1
+    assert summary.subpaths[0].path == str(tmp_path / "sub")
+    assert summary.subpaths[0].file_types[0].type == "gz"
+
+
+def test_get_default_lookup_is_shared():
+    lookup = files.get_default_lookup()
+    assert lookup is files.get_default_lookup()
+    assert lookup.get_file_info("module.PY").type == "programming"
+
+
+def test_directory_details_groups_by_kind(tmp_path):
+    (tmp_path / "a.py").write_text("x")
+    (tmp_path / "b.PY").write_text("x")
+    (tmp_path / "c.json").write_text("{}")
+    (tmp_path / "README").write_text("x")
+    details = files.directory_details(str(tmp_path), files.get_default_lookup())
+    assert details.num_files == 4
+    assert [(t.kind, t.percent) for t in details.file_types["programming"]] == [("Python", 50.0)]
+    assert files.get_default_lookup().get_extension_info(".Py").kind == "Python"
+
+
+def test_should_ignore_path_matches_name_or_relative_path(tmp_path):
+    patterns = {"*.log", "build", "docs/generated"}
+    assert files.should_ignore_path(tmp_path / "a" / "x.log", patterns, tmp_path)
+    assert files.should_ignore_path(tmp_path / "src" / "build", patterns, tmp_path)
+    assert files.should_ignore_path(tmp_path / "docs" / "generated", patterns, tmp_path)
+    assert not files.should_ignore_path(tmp_path / "docs" / "index.md", patterns, tmp_path)
+    assert not files.should_ignore_path(tmp_path / "x.log", set(), tmp_path)
+
+
+def test_directory_walkers_prune_heavy_directories(tmp_path):
+    (tmp_path / "app.js").write_text("x")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").write_text("x")
+    (tmp_path / "build").write_text("a file named like a pruned directory")
+    summary = files.directory_summary(str(tmp_path))
+    assert summary.num_files == 2
+    assert summary.subpaths == []
+    details = files.directory_details(str(tmp_path), files.get_default_lookup(), prune_dirs=frozenset())
+    assert [sub.path for sub in details.subpaths] == [str(tmp_path / "node_modules")]
+
+
+def test_list_git_files_keeps_unusual_names(tmp_path):
+    repo = Repo.init(tmp_path)
+    (tmp_path / "café.txt").write_text("x")
+    (tmp_path / "with space.md").write_text("x")
+    (tmp_path / "ignored.log").write_text("x")
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    repo.index.add(["café.txt"])
+    result = files.list_git_files(str(tmp_path))
+    assert sorted(result) == sorted([Path(".gitignore"), Path("café.txt"), Path("with space.md")])
+
+
+def test_list_git_files_not_a_repo(tmp_path):
+    assert isinstance(files.list_git_files(str(tmp_path)), Exception)
+
+
+def test_iter_git_files_is_lazy(tmp_path):
+    Repo.init(tmp_path)
+    (tmp_path / "a.txt").write_text("x")
+    result = files.iter_git_files(str(tmp_path))
+    assert not isinstance(result, list)
+    assert list(result) == [Path("a.txt")]
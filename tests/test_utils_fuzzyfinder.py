@@ -4,11 +4,24 @@ Unit tests for metagit.core.utils.fuzzyfinder
 """
 
 import asyncio
+import subprocess
+import sys
 import threading
 from unittest.mock import MagicMock
 
+import pytest
+from pydantic import ValidationError
+from textual.color import Color
+
 from metagit.core.utils import fuzzyfinder
-from metagit.core.utils.fuzzyfinder import FuzzyFinderApp, FuzzyFinderConfig, _run_textual_app
+from metagit.core.utils.fuzzyfinder import (
+    FuzzyFinder,
+    FuzzyFinderConfig,
+    FuzzyFinderTarget,
+    _compile_color_spec,
+    _parse_color_spec,
+)
+from metagit.core.utils.fuzzyfinder_app import FuzzyFinderApp, _run_textual_app
 
 
 def test_fuzzyfinder_basic():
@@ -29,6 +42,12 @@ def test_fuzzyfinder_no_match():
     assert list(fuzzyfinder.fuzzyfinder("zebra", collection)) == []
 
 
+def test_fuzzyfinder_limit():
+    collection = ["apple", "banana", "grape", "apricot", "map"]
+    results = fuzzyfinder.fuzzyfinder("ap", collection)
+    assert fuzzyfinder.fuzzyfinder("ap", collection, limit=2) == results[:2]
+
+
 def test_fuzzyfinder_app_search_not_capped_by_max_results():
     config = FuzzyFinderConfig(items=["a", "b", "c"], max_results=1)
     app = FuzzyFinderApp(config)
@@ -36,6 +55,217 @@ def test_fuzzyfinder_app_search_not_capped_by_max_results():
     assert results == ["a", "b", "c"]
 
 
+def test_fuzzyfinder_app_search_reuses_prepared_choices():
+    config = FuzzyFinderConfig(items=["banana", "apple", "apricot"], score_threshold=60.0)
+    app = FuzzyFinderApp(config)
+    assert app._search("") == ["apple", "apricot", "banana"]
+    choices = config.get_choices()
+    assert app._search("apr") == ["apricot", "apple"]
+    assert config.get_choices() is choices
+
+
+def test_fuzzyfinder_app_search_case_insensitive_by_default():
+    items = ["README.md", "Makefile", "setup.py"]
+    app = FuzzyFinderApp(FuzzyFinderConfig(items=items, score_threshold=90.0))
+    assert app._search("readme") == ["README.md"]
+    assert app.config.get_choices().display == ["Makefile", "README.md", "setup.py"]
+    assert app.config.get_choices().preview == [None, None, None]
+
+    sensitive = FuzzyFinderApp(FuzzyFinderConfig(items=items, score_threshold=90.0, case_sensitive=True))
+    assert sensitive._search("readme") == []
+
+
+def test_fuzzyfinder_app_search_substring_matches_score_full():
+    items = ["src/metagit/cli", "docs/index.md", "metagit.yml", "tests/unit"]
+    config = FuzzyFinderConfig(items=items, score_threshold=85.0)
+    app = FuzzyFinderApp(config)
+    assert app._search("metagit") == ["metagit.yml", "src/metagit/cli"]
+
+    ratio_app = FuzzyFinderApp(FuzzyFinderConfig(items=items, score_threshold=85.0, scorer="ratio"))
+    assert ratio_app._search("metagit") == []
+
+
+def test_fuzzyfinder_app_search_reuses_ranking_for_repeated_query():
+    config = FuzzyFinderConfig(items=["alpha", "beta", "gamma"])
+    app = FuzzyFinderApp(config)
+    assert app._search("Beta") == ["beta"]
+    assert app._search("be") == ["beta"]
+    assert app._search("beta") == ["beta"]
+    assert app._cached_ranking.cache_info().hits == 1
+
+    config.items = ["beta", "betamax"]
+    assert app._search("beta") == ["beta", "betamax"]
+    assert app._cached_ranking.cache_info().hits == 0
+
+
+def test_fuzzyfinder_app_search_short_name_scorers():
+    items = ["main.py", "models.py", "README.md"]
+    wratio = FuzzyFinderApp(FuzzyFinderConfig(items=items, scorer="WRatio", score_threshold=80.0))
+    assert wratio._search("main") == ["main.py"]
+
+    jaro = FuzzyFinderApp(FuzzyFinderConfig(items=items, scorer="jaro_winkler", score_threshold=80.0))
+    assert jaro._search("mian.py") == ["main.py"]
+    assert jaro._search("zzz") == []
+
+
+def test_fuzzyfinder_config_get_choices_uses_display_values_as_color_keys():
+    class Task:
+        def __init__(self, name: str, priority: str) -> None:
+            self.name = name
+            self.priority = priority
+
+    items = [Task("deploy", "high"), Task("audit", "low"), FuzzyFinderTarget(name="docs", description="", color="blue")]
+    config = FuzzyFinderConfig(items=items, display_field="name", custom_colors={"audit": "red", "docs": "green"})
+    choices = config.get_choices()
+    assert choices.display == ["audit", "deploy", "docs"]
+    assert choices.styles == [(Color.parse("red"), None), None, (Color.parse("blue"), None)]
+
+    by_priority = FuzzyFinderConfig(
+        items=items[:2], display_field="name", color_field="priority", custom_colors={"high": "red"}
+    )
+    assert by_priority.get_choices().styles == [None, (Color.parse("red"), None)]
+
+
+def test_fuzzyfinder_target_is_hashable_value():
+    target = FuzzyFinderTarget(name="api", description="REST API", color="red")
+    assert target == FuzzyFinderTarget(name="api", description="REST API", color="red")
+    assert len({target, FuzzyFinderTarget(name="api", description="REST API", color="red")}) == 1
+    with pytest.raises(ValidationError):
+        target.name = "other"
+
+
+def test_fuzzyfinder_config_get_choices_extracts_fields_once():
+    items = [
+        FuzzyFinderTarget(name="beta", description="second", color="red"),
+        FuzzyFinderTarget(name="alpha", description="first", opacity=0.5),
+    ]
+    config = FuzzyFinderConfig(
+        items=items,
+        display_field="name",
+        enable_preview=True,
+        preview_field="description",
+        item_opacity=0.8,
+    )
+    choices = config.get_choices()
+    assert choices.items == [items[1], items[0]]
+    assert choices.display == ["alpha", "beta"]
+    assert choices.preview == ["first", "second"]
+    assert choices.styles == [None, (Color.parse("red"), None)]
+    assert choices.opacities == [0.5, 0.8]
+
+
+@pytest.mark.asyncio
+async def test_fuzzyfinder_app_debounces_keystrokes(monkeypatch) -> None:
+    config = FuzzyFinderConfig(items=["alpha", "beta", "gamma"], debounce_seconds=0.3)
+    app = FuzzyFinderApp(config)
+    queries = []
+    perform_search = app._perform_search
+
+    def _record(query: str) -> None:
+        queries.append(query)
+        perform_search(query)
+
+    monkeypatch.setattr(app, "_perform_search", _record)
+    async with app.run_test() as pilot:
+        await pilot.press("b", "e", "t")
+        await pilot.pause(0.5)
+        assert queries == ["", "bet"]
+        assert app.current_results == ["beta"]
+
+        await pilot.press("backspace", "backspace", "backspace", "g")
+        await pilot.press("enter")
+    assert app.return_value == "gamma"
+
+
+@pytest.mark.asyncio
+async def test_fuzzyfinder_app_builds_each_preview_once() -> None:
+    config = FuzzyFinderConfig(
+        items=[
+            FuzzyFinderTarget(name="alpha", description="first"),
+            FuzzyFinderTarget(name="beta", description="second"),
+        ],
+        display_field="name",
+        enable_preview=True,
+        preview_field="description",
+        preview_header="Details",
+        debounce_seconds=0,
+    )
+    app = FuzzyFinderApp(config)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.press("down", "up", "down")
+        await pilot.pause()
+        assert app._cached_preview(1) == "Details\n\nsecond"
+        info = app._cached_preview.cache_info()
+        assert info.currsize == 2
+        assert info.hits >= 2
+
+
+def test_parse_color_spec():
+    assert _parse_color_spec("#ff6600") == ("#ff6600", None)
+    assert _parse_color_spec("bg:#112233") == (None, "#112233")
+    assert _parse_color_spec("white bg:#ff0000") == ("white", "#ff0000")
+    assert _parse_color_spec("bold red") == ("bold red", None)
+
+
+@pytest.mark.asyncio
+async def test_fuzzyfinder_app_cursor_moves_keep_rendered_rows() -> None:
+    config = FuzzyFinderConfig(items=["alpha", "beta", "gamma"], debounce_seconds=0)
+    app = FuzzyFinderApp(config)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        results_list = app.query_one("#results_list")
+        rows = list(results_list.children)
+        await pilot.press("down", "down")
+        await pilot.pause()
+        assert list(results_list.children) == rows
+        assert [row.has_class("highlighted") for row in rows] == [False, False, True]
+
+        await pilot.press("b")
+        await pilot.pause()
+        assert app.current_results == ["beta"]
+        assert len(results_list.children) == 1
+        assert results_list.children[0].has_class("highlighted")
+
+
+@pytest.mark.asyncio
+async def test_fuzzyfinder_app_builds_rows_a_window_at_a_time() -> None:
+    items = [f"item{i:02d}" for i in range(25)]
+    app = FuzzyFinderApp(FuzzyFinderConfig(items=items, max_results=5, debounce_seconds=0))
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        results_list = app.query_one("#results_list")
+        assert len(app.current_results) == 25
+        assert len(results_list.children) == 5
+
+        await pilot.press(*["down"] * 5)
+        await pilot.pause()
+        assert len(results_list.children) == 10
+        assert [row.has_class("highlighted") for row in results_list.children].index(True) == 5
+
+        await pilot.press("enter")
+    assert app.return_value == "item05"
+
+
+@pytest.mark.asyncio
+async def test_fuzzyfinder_run_async_awaits_app(monkeypatch) -> None:
+    async def _fake_run_async(self) -> str:
+        return "beta"
+
+    monkeypatch.setattr(FuzzyFinderApp, "run_async", _fake_run_async)
+    config = FuzzyFinderConfig(items=["alpha", "beta"])
+    assert await FuzzyFinder(config).run_async() == "beta"
+
+    config = FuzzyFinderConfig(items=["alpha", "beta"], multi_select=True)
+    assert await FuzzyFinder(config).run_async() == ["beta"]
+
+
+def test_compile_color_spec():
+    assert _compile_color_spec("white bg:#ff0000") == (Color.parse("white"), Color.parse("#ff0000"))
+    assert _compile_color_spec("bold red") == (Color.parse("red"), None)
+    assert _compile_color_spec("not-a-color") is None
+
+
 def test_run_textual_app_uses_thread_when_event_loop_is_running(monkeypatch) -> None:
     app = MagicMock()
     app.run.return_value = "selected"
@@ -72,3 +302,8 @@ def test_run_textual_app_uses_thread_when_event_loop_is_running(monkeypatch) ->
     loop.call_soon_threadsafe(loop.stop)
     loop_thread.join(timeout=2)
     loop.close()
+
+
+def test_fuzzyfinder_import_does_not_load_textual_app() -> None:
+    code = "import sys, metagit.core.utils.fuzzyfinder; sys.exit('textual.app' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0